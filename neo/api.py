@@ -3,14 +3,17 @@ import logging
 import inspect
 import re
 import requests
-from StringIO import StringIO
 import copy
+import time
+
+from lxml import etree
 
 from django.conf import settings
 from django.core import exceptions
 from django.utils.translation import ugettext_lazy as _
 
-from neo.xml import parseString, GDSParseError, ResponseListType, ResponseType
+from neo import xml
+from neo.budget import record_call
 
 
 # get Neo config from Django settings module
@@ -76,11 +79,11 @@ def _get_error(response):
         exception = Exception("Neo Web Services not responding")
     else:
         try:
-            neo_resp = parseString(response.content)
+            neo_resp = xml.parseString(response.content)
             errors = None
-            if isinstance(neo_resp, ResponseListType):
+            if isinstance(neo_resp, xml.ResponseListType):
                 errors = neo_resp.Response
-            elif isinstance(neo_resp, ResponseType):
+            elif isinstance(neo_resp, xml.ResponseType):
                 errors = [neo_resp]
             else:
                 exception = Exception(response.content)
@@ -104,7 +107,7 @@ def _get_error(response):
                         exception = Exception(response.content)
                 if not exception:
                     exception = exceptions.ValidationError(err_msg_list)
-        except GDSParseError:
+        except (xml.GDSParseError, etree.XMLSyntaxError):
             exception = Exception(response.content)
 
     log_api_call(function_call_tup=inspect.stack()[1],
@@ -113,6 +116,18 @@ def _get_error(response):
     return exception
 
 
+def _request(method, *args, **kwargs):
+    '''
+    Make a request with the given requests method, counting it towards
+    the active Neo call budgets
+    '''
+    start = time.time()
+    try:
+        return method(*args, **kwargs)
+    finally:
+        record_call(time.time() - start)
+
+
 def _get_auth_header(username, password, promo_code):
     '''
     Create HTTP Authorization header
@@ -144,7 +159,7 @@ def authenticate(username=None, password=None, token=None, promo_code=None, acq_
     if acq_src:
         params['acquisitionsource'] = acq_src
 
-    response = requests.get("%s/consumers/useraccount/" % (BASE_URL, ),
+    response = _request(requests.get, "%s/consumers/useraccount/" % (BASE_URL, ),
         params=params, **get_kwargs())
     log_api_call(status_code=response.status_code)
     if response.status_code == 200:
@@ -159,7 +174,7 @@ def logout(consumer_id, promo_code=None, acq_src=None):
     params = {'promocode': promo_code if promo_code else CONFIG['PROMO_CODE']}
     if acq_src:
         params['acquisitionsource'] = acq_src
-    response = requests.put("%s/consumers/%s/useraccount/notifylogout" % (BASE_URL, consumer_id),
+    response = _request(requests.put, "%s/consumers/%s/useraccount/notifylogout" % (BASE_URL, consumer_id),
         params=params, **get_kwargs(no_content=True))
     if response.status_code != 200:
         raise _get_error(response)
@@ -170,7 +185,7 @@ def remember_me(consumer_id, token):
     '''
     Stores a remember me token on Neo server
     '''
-    response = requests.put("%s/consumers/%s/useraccount" % (BASE_URL, consumer_id),
+    response = _request(requests.put, "%s/consumers/%s/useraccount" % (BASE_URL, consumer_id),
         params={'authtoken': token}, **get_kwargs())
     if response.status_code != 200:
         raise _get_error(response)
@@ -181,12 +196,8 @@ def create_consumer(consumer):
     '''
     Creates a consumer and returns the consumer id and validation uri
     '''
-    data_stream = StringIO()
-    # write the consumer data in xml to a string stream
-    consumer.export(data_stream, 0)
-    response = requests.post("%s/consumers" % (BASE_URL, ),
-        data=data_stream.getvalue(), **get_kwargs())
-    data_stream.close()
+    response = _request(requests.post, "%s/consumers" % (BASE_URL, ),
+        data=xml.export_compact_(consumer), **get_kwargs())
     if response.status_code == 201:
         log_api_call(status_code=201)
         # parse the consumer_id in location header
@@ -203,10 +214,10 @@ def complete_registration(consumer_id, uri=None):
     Activates the newly created consumer account, optionally using a validation uri
     '''
     if not uri:
-        response = requests.post("%s/consumers/%s/registration" % (BASE_URL, consumer_id),
+        response = _request(requests.post, "%s/consumers/%s/registration" % (BASE_URL, consumer_id),
             **get_kwargs(no_content=True))
     else:
-        response = requests.get(uri)
+        response = _request(requests.get, uri)
     if response.status_code != 200:
         raise _get_error(response)
     log_api_call()
@@ -219,14 +230,14 @@ def get_consumers(email_id, dob):
     [{'ConsumerID': val, 'LoginName': val, 'ApplicationName': val}, ...]
     '''
     dob_str = dob.strftime("%Y%m%d")
-    response = requests.get("%s/consumers/" % (BASE_URL, ),
+    response = _request(requests.get, "%s/consumers/" % (BASE_URL, ),
         params = {'dateofbirth': dob_str, 'emailid': email_id}, **get_kwargs())
     if response.status_code == 200:
         try:
-            consumers = parseString(response.content).Consumer
+            consumers = xml.parseString(response.content).Consumer
             log_api_call()
-            return [o.__dict__ for o in consumers]
-        except GDSParseError:
+            return [xml.as_dict_(o) for o in consumers]
+        except xml.GDSParseError:
             pass
     
     raise _get_error(response)
@@ -245,31 +256,53 @@ def link_consumer(consumer_id, username, password, promo_code=None, acq_src=None
     }
     if acq_src:
         params['acquisitionsource'] = acq_src
-    response = requests.put("%s/consumers/%s/registration/" % (BASE_URL, consumer_id),
+    response = _request(requests.put, "%s/consumers/%s/registration/" % (BASE_URL, consumer_id),
         params=params, **get_kwargs())
     if response.status_code == 200:
         try:
-            obj_from_xml = parseString(response.content)
+            obj_from_xml = xml.parseString(response.content)
             log_api_call()
             return obj_from_xml
-        except GDSParseError:
+        except xml.GDSParseError:
             pass
 
     raise _get_error(response)
 
 
-def get_consumer(consumer_id, username=None, password=None, promo_code=None):
+def get_consumer(consumer_id, username=None, password=None, promo_code=None, lazy=False):
     '''
     Get a consumer object containing all the consumer data
+
+    With lazy, the parts of the consumer are only built from the XML
+    when they are first accessed, and parse errors are raised then.
     '''
-    response = requests.get("%s/consumers/%s/all" % (BASE_URL, consumer_id),
+    response = _request(requests.get, "%s/consumers/%s/all" % (BASE_URL, consumer_id),
         **get_kwargs(username=username, password=password, promo_code=promo_code))
     if response.status_code == 200:
         try:
-            obj_from_xml = parseString(response.content)
+            obj_from_xml = xml.parseString(response.content, lazy=lazy)
             log_api_call()
             return obj_from_xml
-        except GDSParseError:
+        except xml.GDSParseError:
+            pass
+
+    raise _get_error(response)
+
+
+def get_consumer_xml(consumer_id, username=None, password=None, promo_code=None):
+    '''
+    Get the parsed XML element of a consumer containing all the consumer
+    data, without building the consumer objects (see
+    `neo.utils.consumer_member_dict`)
+    '''
+    response = _request(requests.get, "%s/consumers/%s/all" % (BASE_URL, consumer_id),
+        **get_kwargs(username=username, password=password, promo_code=promo_code))
+    if response.status_code == 200:
+        try:
+            root = xml.parsexml_string_(response.content)
+            log_api_call()
+            return root
+        except etree.XMLSyntaxError:
             pass
 
     raise _get_error(response)
@@ -279,14 +312,14 @@ def get_consumer_profile(consumer_id, username=None, password=None, promo_code=N
     '''
     Get a consumer's profile
     '''
-    response = requests.get("%s/consumers/%s/profile" % (BASE_URL, consumer_id),
+    response = _request(requests.get, "%s/consumers/%s/profile" % (BASE_URL, consumer_id),
         **get_kwargs(username=username, password=password, promo_code=promo_code))
     if response.status_code == 200:
         try:
-            obj_from_xml = parseString(response.content)
+            obj_from_xml = xml.parseString(response.content)
             log_api_call()
             return obj_from_xml
-        except GDSParseError:
+        except xml.GDSParseError:
             pass
 
     raise _get_error(response)
@@ -302,13 +335,13 @@ def get_consumer_preferences(consumer_id, category_id=None,
     uri = "%s/consumers/%s/preferences" % (BASE_URL, consumer_id)
     if category_id:
         uri += "/category/%s" % category_id
-    response = requests.get(uri, **get_kwargs(username=username, password=password, promo_code=promo_code))
+    response = _request(requests.get, uri, **get_kwargs(username=username, password=password, promo_code=promo_code))
     if response.status_code == 200:
         try:
-            obj_from_xml = parseString(response.content)
+            obj_from_xml = xml.parseString(response.content)
             log_api_call()
             return obj_from_xml
-        except GDSParseError:
+        except xml.GDSParseError:
             pass
 
     raise _get_error(response)
@@ -318,12 +351,8 @@ def update_consumer(consumer_id, consumer, username=None, password=None, promo_c
     '''
     Update a consumer's data on the Neo server
     '''
-    data_stream = StringIO()
-    # write the consumer data in xml to a string stream
-    consumer.export(data_stream, 0)
-    response = requests.put("%s/consumers/%s" % (BASE_URL, consumer_id),
-        data=data_stream.getvalue(), **get_kwargs(username=username, password=password, promo_code=promo_code))
-    data_stream.close()
+    response = _request(requests.put, "%s/consumers/%s" % (BASE_URL, consumer_id),
+        data=xml.export_compact_(consumer), **get_kwargs(username=username, password=password, promo_code=promo_code))
     if response.status_code != 200:
         raise _get_error(response)
     log_api_call()
@@ -331,20 +360,14 @@ def update_consumer(consumer_id, consumer, username=None, password=None, promo_c
 
 def _update_question_answers(consumer_id, object, category_id=None, create=False,
     username=None, password=None, promo_code=None, root_tag_name=None, uri=None):
-    data_stream = StringIO()
-    # write the consumer data in xml to a string stream
-    if root_tag_name:
-        object.export(data_stream, 0, name_=root_tag_name)
-    else:
-        object.export(data_stream, 0)
+    data = xml.export_compact_(object, root_tag_name)
     if not uri:
         uri = "%s/consumers/%s/%s" % (BASE_URL, consumer_id,
             root_tag_name.lower() if root_tag_name else object.__name__.lower())
     if category_id:
         uri += "/category/%s" % category_id
-    response = getattr(requests, 'post' if create else 'put')(uri, data=data_stream.getvalue(),
+    response = _request(requests.post if create else requests.put, uri, data=data,
         **get_kwargs(username=username, password=password, promo_code=promo_code))
-    data_stream.close()
     if response.status_code != 200:
         raise _get_error(response)
     log_api_call(function_call_tup=inspect.stack()[1])
@@ -394,14 +417,14 @@ def get_forgot_password_token(username):
         'loginname': username,
         'temptoken': 0
     }
-    response = requests.get("%s/consumers/useraccount" % (BASE_URL, ),
+    response = _request(requests.get, "%s/consumers/useraccount" % (BASE_URL, ),
         params=params, **get_kwargs())
     if response.status_code == 200:
         try:
-            obj_from_xml = parseString(response.content)
+            obj_from_xml = xml.parseString(response.content)
             log_api_call()
             return obj_from_xml
-        except GDSParseError:
+        except xml.GDSParseError:
             pass
 
     raise _get_error(response)
@@ -422,7 +445,7 @@ def change_password(username, new_password, old_password=None, token=None):
         params['temptoken'] = token
     else:
         raise ValueError("Either the old password or the forgot password token needs to be specified.")
-    response = requests.put("%s/consumers/useraccount" % (BASE_URL, ),
+    response = _request(requests.put, "%s/consumers/useraccount" % (BASE_URL, ),
         params=params, **get_kwargs(no_content=True))
 
     if response.status_code == 200:
@@ -437,12 +460,8 @@ def unsubscribe(consumer_id, unsubscribe_obj):
     Unsubscribe from some brand or communication channel
     The user must be logged in
     '''
-    data_stream = StringIO()
-    # write the unsubscribe data in xml to a string stream
-    unsubscribe_obj.export(data_stream, 0)
-    response = requests.put("%s/consumers/%s/preferences/unsubscribe" % (BASE_URL, consumer_id),
-        data=data_stream.getvalue(), **get_kwargs())
-    data_stream.close()
+    response = _request(requests.put, "%s/consumers/%s/preferences/unsubscribe" % (BASE_URL, consumer_id),
+        data=xml.export_compact_(unsubscribe_obj), **get_kwargs())
     if response.status_code != 200:
         raise _get_error(response)
     log_api_call()
@@ -455,7 +474,7 @@ def add_promo_code(consumer_id, promo_code, acq_src=None, username=None, passwor
     params = {'promocode': promo_code}
     if acq_src:
         params['acquisitionsource'] = acq_src
-    response = requests.put("%s/consumers/%s" % (BASE_URL, consumer_id),
+    response = _request(requests.put, "%s/consumers/%s" % (BASE_URL, consumer_id),
         params=params, **get_kwargs(username=username, password=password, no_content=True))
     if response.status_code != 200:
         raise _get_error(response)
@@ -474,14 +493,14 @@ def do_age_check(dob, country_code, gateway_id, language_code=None):
     }
     if language_code:
         params['language_code'] = language_code
-    response = requests.get("%s/consumers/affirmage" % (BASE_URL, ),
+    response = _request(requests.get, "%s/consumers/affirmage" % (BASE_URL, ),
         params=params, **get_kwargs())
     if response.status_code == 200:
         try:
-            obj_from_xml = parseString(response.content)
+            obj_from_xml = xml.parseString(response.content)
             log_api_call()
             return obj_from_xml
-        except GDSParseError:
+        except xml.GDSParseError:
             pass
 
     raise _get_error(response)
@@ -497,14 +516,14 @@ def get_country(country_code=None, ip_address=None):
         params = {'ipaddress': ip_address}
     else:
         raise ValueError("Either the country code or ip address needs to be specified.")
-    response = requests.get("%s/country/" % (BASE_URL, ),
+    response = _request(requests.get, "%s/country/" % (BASE_URL, ),
         params=params, **get_kwargs())
     if response.status_code == 200:
         try:
-            obj_from_xml = parseString(response.content)
+            obj_from_xml = xml.parseString(response.content)
             log_api_call()
             return obj_from_xml
-        except GDSParseError:
+        except xml.GDSParseError:
             pass
 
     raise _get_error(response)
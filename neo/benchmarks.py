@@ -0,0 +1,249 @@
+'''
+Microbenchmarks for the hot paths in jmbo-neo
+
+These need a configured Django project, so run them from a shell, e.g.
+
+    $ python manage.py shell
+    >>> from neo import benchmarks
+    >>> benchmarks.member_conversion(Member.objects.all()[0])
+'''
+import timeit
+
+
+def timed(func, number=10000):
+    '''
+    Return the mean time per call of func in microseconds
+    '''
+    return timeit.Timer(func).timeit(number) * 1e6 / number
+
+
+def member_conversion(member, number=10000):
+    '''
+    The per-save overhead of converting a member for Neo: wrapping a new
+    member, diffing a changed member against its cached attributes and
+    stashing the Neo fields
+    '''
+    from neo.models import NEO_ATTR, ADDRESS_FIELDS, wrap_member, diff_member, stash_neo_fields
+
+    old_member = dict((k, getattr(member, k)) for k in NEO_ATTR.union(ADDRESS_FIELDS))
+    old_member['first_name'] = 'changed %s' % old_member['first_name']
+    return {
+        'wrap_member': timed(lambda: wrap_member(member), number),
+        'diff_member': timed(lambda: diff_member(member, old_member), number),
+        'stash_neo_fields': timed(lambda: stash_neo_fields(member), number),
+    }
+
+
+def record_serialization(member, number=10000):
+    '''
+    Converting a wrapped member to the lxml element written by
+    `dataloadtool_export`: via a string and re-parsing it, as before, and
+    directly with `gds_to_etree`
+    '''
+    from StringIO import StringIO
+    from lxml import etree
+    from neo.models import wrap_member
+    from neo.utils import gds_to_etree
+
+    consumer = wrap_member(member, login_alias=member.username.lower(), password='password').consumer
+
+    def round_trip():
+        sio = StringIO()
+        consumer.export(sio, 0, pretty_print=False)
+        return etree.fromstring(sio.getvalue())
+
+    return {
+        'export_and_parse': timed(round_trip, number),
+        'gds_to_etree': timed(lambda: gds_to_etree(consumer, 'Consumer'), number),
+    }
+
+
+def response_parsing(member, number=10000):
+    '''
+    Parsing the most common Neo responses: with a new parser per call and
+    through a file-like object, as before, and with `neo.xml.parseString`,
+    which reuses a parser per thread and parses the bytes directly
+    '''
+    from StringIO import StringIO
+    from neo import xml
+    from neo.models import wrap_member
+
+    responses = {
+        'Consumer': (wrap_member(member, login_alias=member.username.lower(), password='password').consumer,
+                     'Consumer'),
+        'ResponseListType': (xml.ResponseListType(Response=[xml.ResponseType('OK', 'Success')] * 2),
+                             'Responses'),
+        'ConsumerIDAndApplicationsType': (xml.ConsumerIDAndApplicationsType(Consumer=[
+            xml.ConsumerIDAndApplicationType(1234, member.username.lower(), 'application')]),
+            'ConsumerIDAndApplications'),
+        'CountryType': (xml.CountryType(CountryCode='ZA', DefaultLanguageCode='en', CurrencyCode='ZAR',
+                                        RedirectURL='http://www.example.com/'), 'Country'),
+    }
+
+    def parse_file(data):
+        root = xml.parsexml_(StringIO(data)).getroot()
+        obj = xml.get_root_tag(root)[1].factory()
+        obj.build(root)
+        return obj
+
+    results = {}
+    for name, (obj, tag) in responses.items():
+        sio = StringIO()
+        obj.export(sio, 0, name_=tag, pretty_print=False)
+        data = sio.getvalue()
+        results[name] = {
+            'parse_file': timed(lambda: parse_file(data), number),
+            'parseString': timed(lambda: xml.parseString(data), number),
+        }
+    return results
+
+
+def consumer_building(member, number=10000):
+    '''
+    Building a parsed Consumer with the buildChildren if/elif chain of each
+    class, as before, and with the build tables of `neo.xml`
+    '''
+    from StringIO import StringIO
+    from neo import xml
+    from neo.models import wrap_member
+
+    sio = StringIO()
+    wrap_member(member, login_alias=member.username.lower(), password='password').consumer.export(
+        sio, 0, pretty_print=False)
+    root = xml.parsexml_string_(sio.getvalue())
+
+    def build():
+        xml.Consumer().build(root)
+
+    tables = dict(xml.build_tables_)
+    xml.build_tables_.clear()
+    try:
+        build_children = timed(build, number)
+    finally:
+        xml.build_tables_.update(tables)
+    return {
+        'buildChildren': build_children,
+        'build_tables_': timed(build, number),
+    }
+
+
+def deep_sizeof(obj, seen=None):
+    '''
+    Return the size in bytes of a parsed `neo.xml` object and everything it
+    holds, counting shared objects once
+    '''
+    import sys
+
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (list, tuple)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif hasattr(obj, '__dict__'):
+        size += deep_sizeof(obj.__dict__, seen)
+    for name in getattr(type(obj), '__slots__', ()):
+        size += deep_sizeof(getattr(obj, name, None), seen)
+    return size
+
+
+def consumer_memory(member, count=10000):
+    '''
+    The memory held by `count` Consumers parsed from the member's export,
+    in bytes per `count` consumers
+    '''
+    from StringIO import StringIO
+    from neo import xml
+    from neo.models import wrap_member
+
+    sio = StringIO()
+    wrap_member(member, login_alias=member.username.lower(), password='password').consumer.export(
+        sio, 0, pretty_print=False)
+    data = sio.getvalue()
+    # keep the consumers alive, so that no two of them share an id
+    consumers = [xml.parseString(data) for i in xrange(count)]
+    seen = set()
+    return sum(deep_sizeof(consumer, seen) for consumer in consumers)
+
+
+def lazy_consumer(member, number=10000):
+    '''
+    Parsing a consumer and reading the fields that `load_consumer` reads
+    without a database query: building the whole consumer, as before, and
+    with `parseString(lazy=True)`, which only builds the parts read
+    '''
+    from StringIO import StringIO
+    from neo import xml
+    from neo.models import wrap_member
+    from neo.utils import ConsumerWrapper
+
+    sio = StringIO()
+    wrap_member(member, login_alias=member.username.lower(), password='password').consumer.export(
+        sio, 0, pretty_print=False)
+    data = sio.getvalue()
+    fields = ('first_name', 'last_name', 'dob', 'gender', 'email', 'mobile_number', 'receive_sms',
+              'receive_email', 'country_code')
+
+    def read(lazy):
+        wrapper = ConsumerWrapper(consumer=xml.parseString(data, lazy=lazy))
+        return [getattr(wrapper, field) for field in fields]
+
+    return {
+        'parseString': timed(lambda: read(False), number),
+        'lazy': timed(lambda: read(True), number),
+    }
+
+
+def member_extraction(member, number=10000):
+    '''
+    Reading the member attributes from a consumer's XML, as `load_consumer`
+    does: through a `ConsumerWrapper` of the parsed consumer, as before, and
+    with `consumer_member_dict`. Both include the country queries.
+    '''
+    from StringIO import StringIO
+    from neo import xml
+    from neo.models import NEO_ATTR, wrap_member
+    from neo.utils import ConsumerWrapper, consumer_member_dict
+
+    sio = StringIO()
+    wrap_member(member, login_alias=member.username.lower(), password='password').consumer.export(
+        sio, 0, pretty_print=False)
+    data = sio.getvalue()
+
+    def wrapper_dict():
+        wrapper = ConsumerWrapper(consumer=xml.parseString(data))
+        member_dict = dict((k, getattr(wrapper, k)) for k in NEO_ATTR)
+        member_dict.update(wrapper.address)
+        return member_dict
+
+    return {
+        'ConsumerWrapper': timed(wrapper_dict, number),
+        'consumer_member_dict': timed(lambda: consumer_member_dict(data), number),
+    }
+
+
+def payload_serialization(member, number=10000):
+    '''
+    Serializing a wrapped member for `create_consumer`: with `export`,
+    pretty printed as before and compact, and with `neo.xml.export_compact_`
+    '''
+    from StringIO import StringIO
+    from neo import xml
+    from neo.models import wrap_member
+
+    consumer = wrap_member(member, login_alias=member.username.lower(), password='password').consumer
+
+    def export(pretty_print):
+        sio = StringIO()
+        consumer.export(sio, 0, pretty_print=pretty_print)
+        return sio.getvalue()
+
+    return {
+        'export': timed(lambda: export(True), number),
+        'export_compact': timed(lambda: export(False), number),
+        'export_compact_': timed(lambda: xml.export_compact_(consumer), number),
+    }
@@ -0,0 +1,97 @@
+'''
+Accounting of Neo API calls, to catch code that makes a Neo call per
+member - e.g. through `load_consumer` when a view iterates over members
+'''
+import logging
+import threading
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+# The maximum number of Neo calls and seconds spent on Neo calls per request (None for no limit)
+MAX_CALLS = settings.NEO.get('REQUEST_MAX_CALLS', None)
+MAX_TIME = settings.NEO.get('REQUEST_MAX_TIME', None)
+
+# Raise NeoBudgetExceeded instead of logging a warning when a request is over budget
+RAISE_OVER_BUDGET = settings.NEO.get('RAISE_OVER_BUDGET', False)
+
+
+class NeoBudgetExceeded(Exception):
+    pass
+
+
+class _ActiveBudgets(threading.local):
+    '''
+    Per-thread stack of the `neo_budget` blocks that are active
+    '''
+    def __init__(self):
+        self.stack = []
+
+
+_active = _ActiveBudgets()
+
+
+def record_call(seconds):
+    for budget in _active.stack:
+        budget.calls += 1
+        budget.time += seconds
+
+
+def record_cache_lookup():
+    for budget in _active.stack:
+        budget.cache_lookups += 1
+
+
+class neo_budget(object):
+    '''
+    Context manager that counts the Neo calls, member cache lookups and time
+    spent on Neo calls in a block. Only calls made by the current thread are
+    counted, so background notifications and deferred updates aren't.
+
+    On exit, a warning is logged (or `NeoBudgetExceeded` is raised) if the
+    block made more than `max_calls` Neo calls or spent more than `max_time`
+    seconds on them.
+    '''
+
+    def __init__(self, max_calls=MAX_CALLS, max_time=MAX_TIME, raise_over_budget=RAISE_OVER_BUDGET, name=None):
+        self.max_calls = max_calls
+        self.max_time = max_time
+        self.raise_over_budget = raise_over_budget
+        self.name = name
+        self.calls = 0
+        self.cache_lookups = 0
+        self.time = 0.0
+
+    def __enter__(self):
+        _active.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _active.stack.remove(self)
+        if exc_type is None:
+            self.check()
+        return False
+
+    def discard(self):
+        '''
+        Stop counting without checking the budget, e.g. when the block it was
+        entered for was abandoned without exiting it
+        '''
+        if self in _active.stack:
+            _active.stack.remove(self)
+
+    @property
+    def over_budget(self):
+        return ((self.max_calls is not None and self.calls > self.max_calls) or
+                (self.max_time is not None and self.time > self.max_time))
+
+    def check(self):
+        if not self.over_budget:
+            return
+        message = "%s made %d Neo calls taking %.3fs (%d cache lookups), the budget is %s calls and %ss" % (
+            self.name or 'Block', self.calls, self.time, self.cache_lookups, self.max_calls, self.max_time)
+        if self.raise_over_budget:
+            raise NeoBudgetExceeded(message)
+        logger.warning(message)
@@ -0,0 +1,102 @@
+import os
+import time
+import logging
+import threading
+import Queue
+from multiprocessing.pool import ThreadPool
+
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDispatcher(object):
+    '''
+    Makes Neo calls whose results aren't needed (e.g. login and logout
+    notifications) from a background thread, so that they don't add to
+    request latency.
+
+    Calls are queued in a bounded queue. When the queue is full, `dispatch`
+    waits up to `put_timeout` seconds for space and then drops the call.
+    The background thread sends queued calls in batches of up to
+    `batch_size`, using `workers` concurrent requests.
+    '''
+
+    def __init__(self, max_queue_size=1000, batch_size=20, workers=2, put_timeout=0.05):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.workers = workers
+        self.put_timeout = put_timeout
+        self.stats = {'queued': 0, 'sent': 0, 'failed': 0, 'dropped': 0}
+        self._lock = threading.Lock()
+        self._pid = None
+
+    def _ensure_started(self):
+        # (re)start the thread in forked worker processes too
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self._queue = Queue.Queue(self.max_queue_size)
+                self._pool = ThreadPool(self.workers)
+                thread = threading.Thread(target=self._run, name='neo-notifications')
+                thread.daemon = True
+                thread.start()
+                self._pid = os.getpid()
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def dispatch(self, func, *args, **kwargs):
+        '''
+        Queue a call to func. Returns False if the call had to be dropped.
+        '''
+        self._ensure_started()
+        try:
+            self._queue.put((func, args, kwargs), timeout=self.put_timeout)
+        except Queue.Full:
+            self._count('dropped')
+            logger.warning("Neo notification queue is full, dropped %s call", func.__name__)
+            return False
+        self._count('queued')
+        return True
+
+    def flush(self, timeout=None):
+        '''
+        Block until all queued calls have been sent, or for at most `timeout`
+        seconds. Returns False if calls were still queued after the timeout.
+        '''
+        if self._pid != os.getpid():
+            return True
+        if timeout is None:
+            self._queue.join()
+            return True
+        deadline = time.time() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _send(self, call):
+        func, args, kwargs = call
+        try:
+            func(*args, **kwargs)
+            self._count('sent')
+        except Exception:
+            self._count('failed')
+            logger.exception("Neo notification %s failed", func.__name__)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Queue.Empty:
+                    break
+            self._pool.map(self._send, batch)
+            for call in batch:
+                self._queue.task_done()
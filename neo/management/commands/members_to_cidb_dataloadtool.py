@@ -1,13 +1,204 @@
 import os
+import csv
+import gzip
+import json
+import shutil
+import datetime
+import tempfile
 from os import path
 from functools import reduce
 from optparse import make_option
 from textwrap import dedent
+from multiprocessing import Pool
+
+from lxml import etree
+try:
+    import lzma
+except ImportError:
+    try:
+        from backports import lzma
+    except ImportError:
+        lzma = None
 
 from django.core.management.base import NoArgsCommand, CommandError
-from django.utils import importlib
+from django.conf import settings
+from django.db import transaction, connection
+from django.db.models import Q, Max
+from django.utils import importlib, timezone
+from django.utils.dateparse import parse_datetime, parse_date
+
+from neo.models import Member, ExportWatermark, EXPORT_CHUNK_SIZE, dataloadtool_export_records
+from neo.profiling import ExportProfile
+
+
+# The root element of the XML part files written by the workers
+PART_ROOT = 'Consumers'
+
+
+class ExportFile(object):
+    """
+    Binary output file, compressed with gzip or xz if the filename ends in
+    .gz or .xz, that can be checkpointed.
+
+    `checkpoint()` ends the current gzip member or xz stream, as a
+    concatenation of these is still a valid compressed file, and returns the
+    file's size at that point. Opening the file with that `offset` truncates
+    it there and continues writing.
+    """
+
+    def __init__(self, filepath, offset=None):
+        if filepath.endswith('.xz'):
+            if lzma is None:
+                raise CommandError('Writing .xz files needs the lzma module (backports.lzma on Python 2).')
+            self.compression = 'xz'
+        elif filepath.endswith('.gz'):
+            self.compression = 'gz'
+        else:
+            self.compression = None
+        if offset is None:
+            self.file = open(filepath, 'wb')
+        else:
+            self.file = open(filepath, 'r+b')
+            self.file.truncate(offset)
+            self.file.seek(offset)
+        self.skip = ''
+        self._start_segment()
+
+    def _start_segment(self):
+        if self.compression == 'gz':
+            self.segment = gzip.GzipFile(fileobj=self.file, mode='wb')
+        elif self.compression == 'xz':
+            self.segment = lzma.LZMACompressor()
+
+    def _end_segment(self):
+        if self.compression == 'gz':
+            # this doesn't close self.file
+            self.segment.close()
+        elif self.compression == 'xz':
+            self.file.write(self.segment.flush())
+
+    def discard(self, data):
+        """
+        Drop `data` when it is written next, e.g. a header that is already in
+        the file being resumed.
+        """
+        self.skip = data
+
+    def write(self, data):
+        if self.skip:
+            n = min(len(self.skip), len(data))
+            if data[:n] != self.skip[:n]:
+                raise CommandError('Unexpected output {0!r} when resuming.'.format(data[:n]))
+            self.skip, data = self.skip[n:], data[n:]
+            if not data:
+                return
+        if self.compression == 'gz':
+            self.segment.write(data)
+        elif self.compression == 'xz':
+            self.file.write(self.segment.compress(data))
+        else:
+            self.file.write(data)
+
+    def flush(self):
+        self.file.flush()
+
+    def checkpoint(self):
+        self._end_segment()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        offset = self.file.tell()
+        self._start_segment()
+        return offset
+
+    def close(self):
+        self._end_segment()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def plan_shards(members, count):
+    """
+    Split the members, ordered by username, into `count` contiguous shards.
+
+    :return: A (start, first_username, previous_username) tuple for each
+        shard, where start is the index of the shard's first member and
+        previous_username is the username of the last member of the
+        previous shard.
+    """
+    usernames = members.order_by('username').values_list('username', flat=True)
+    total = usernames.count()
+    size = max(1, (total + count - 1) // count)
+    shards = []
+    for start in xrange(0, total, size):
+        if start:
+            previous, first = usernames[start - 1:start + 1]
+        else:
+            previous, first = '', usernames[0]
+        shards.append((start, first, previous))
+    return shards
+
+
+def reject_writer(output):
+    """
+    Return a `reject` function for `dataloadtool_export_records()` that
+    writes the pk of each rejected member and the validation error to output
+    as CSV.
+    """
+    rejects_csv = csv.writer(output)
+
+    def reject(member, error):
+        rejects_csv.writerow([member.pk, error.encode('utf-8')])
+    return reject
+
+
+def export_shard(args):
+    """
+    Export the members in a username range to XML, credentials and (if
+    validating) rejects part files.
+    """
+    (query, start, first, upper, previous, xml_path, csv_path, rejects_path, password_callback, pretty_print,
+     chunk_size) = args
+    members = Member.objects.all()
+    members.query = query
+    members = members.filter(username__gte=first)
+    if upper is not None:
+        members = members.filter(username__lt=upper)
+    callback = None if password_callback is None else Command().load_callback(password_callback)
+    rejects_output = None if rejects_path is None else open(rejects_path, 'wb')
+    try:
+        with open(csv_path, 'w') as credentials_output:
+            with etree.xmlfile(xml_path) as xf:
+                with xf.element(PART_ROOT):
+                    dataloadtool_export_records(xf, credentials_output, members, password_callback=callback,
+                                                pretty_print=pretty_print, start=start,
+                                                last_username=previous.lower(), chunk_size=chunk_size,
+                                                reject=rejects_output and reject_writer(rejects_output))
+    finally:
+        if rejects_output is not None:
+            rejects_output.close()
+    return xml_path, csv_path, rejects_path
+
 
-from neo.models import Member, dataloadtool_export
+def copy_part(xml_path, output):
+    """
+    Copy the records in an XML part file to output, without the part's root element.
+    """
+    start_tag, end_tag = '<%s>' % PART_ROOT, '</%s>' % PART_ROOT
+    remaining = path.getsize(xml_path) - len(start_tag) - len(end_tag)
+    if remaining <= 0:
+        return  # no records
+    with open(xml_path, 'rb') as part:
+        if part.read(len(start_tag)) != start_tag:
+            raise CommandError('Invalid export part {0!r}.'.format(xml_path))
+        while remaining > 0:
+            data = part.read(min(remaining, 1 << 20))
+            output.write(data)
+            remaining -= len(data)
 
 
 class Command(NoArgsCommand):
@@ -15,6 +206,19 @@ class Command(NoArgsCommand):
         Export members as XML for the CIDB Data Load Tool.
 
         By default, only members without existing NeoProfiles are exported.
+        Use --since or --watermark to only export members that joined or were
+        changed since a given time or since the last successful export.
+
+        Output files ending in .gz or .xz are compressed. When writing to a
+        file, progress is checkpointed, and an interrupted export continues
+        where it stopped with --resume.
+
+        With --validate, each record is validated against the Data Load Tool
+        schema, and invalid records are written to a rejects file instead,
+        as CSV rows of the member id and the validation error.
+
+        With --profile, the time and memory spent in each stage of the export
+        are written to standard error, and as JSON to the given file.
 
         Usage: members_to_cidb_dataloadtool credentials_filepath [options]""")
 
@@ -22,13 +226,38 @@ class Command(NoArgsCommand):
         make_option('-f', '--file', dest='filepath', help='Output file (default: standard output)', metavar='FILE'),
         make_option('-p', '--pretty-print', dest='pretty_print', action='store_true', default=False,
                     help='Enable pretty-printing.'),
-        make_option('-a', '--all', dest='pretty_print', action='store_true', default=False,
+        make_option('-a', '--all', dest='all', action='store_true', default=False,
                     help='Export all members, including those with existing NeoProfiles.'),
+        make_option('--since', dest='since',
+                    help='Only export members that joined or were changed since this date or time, '
+                         'e.g. "2014-01-31" or "2014-01-31 18:00".'),
+        make_option('--watermark', dest='watermark', metavar='NAME',
+                    help='Only export members that joined or were changed since the last successful export '
+                         'with this watermark name, and record this export on success.'),
         make_option('--password-callback', dest='password_callback',
-                    help='Provide a password-setting callback, in "some.module:some.function" format.'),
+                    help='Provide a password-setting callback, in "some.module:some.function" format. '
+                         'Callbacks decorated with neo.models.batch_password_callback are passed chunks of members.'),
+        make_option('-w', '--workers', dest='workers', type='int', default=1,
+                    help='Number of processes to export with (default: 1).'),
+        make_option('--validate', dest='validate', action='store_true', default=False,
+                    help='Validate each record, and write invalid records to the rejects file instead.'),
+        make_option('--rejects', dest='rejects', metavar='FILE',
+                    help='Rejects file (default: the credentials filepath with .rejects appended).'),
+        make_option('--profile', dest='profile', metavar='FILE',
+                    help='Profile the stages of the export, and write the profile to FILE as JSON.'),
+        make_option('--chunk-size', dest='chunk_size', type='int', default=EXPORT_CHUNK_SIZE,
+                    help='Number of members to fetch per query (default: %d).' % EXPORT_CHUNK_SIZE),
+        make_option('--checkpoint', dest='checkpoint', metavar='FILE',
+                    help='Checkpoint file (default: the credentials filepath with .checkpoint appended).'),
+        make_option('--checkpoint-interval', dest='checkpoint_interval', type='int', default=10000,
+                    help='Number of records to export between checkpoints, with a single worker (default: 10000).'),
+        make_option('--resume', dest='resume', action='store_true', default=False,
+                    help='Resume an interrupted export with the same files from its checkpoint.'),
     ]
 
-    def handle(self, credentials_filepath, filepath=None, pretty_print=False, all=False, password_callback=None, **options):
+    def handle(self, credentials_filepath, filepath=None, pretty_print=False, all=False, password_callback=None,
+               since=None, watermark=None, workers=1, validate=False, rejects=None, profile=None,
+               chunk_size=EXPORT_CHUNK_SIZE, checkpoint=None, checkpoint_interval=10000, resume=False, **options):
         for p in (credentials_filepath, filepath):
             if p:
                 if not path.isabs(p):
@@ -38,13 +267,170 @@ class Command(NoArgsCommand):
                 elif not os.access(path.dirname(p), os.W_OK):
                     raise Exception("Output directory %s does not have write access." % p)
 
-        members = self.get_members(include_all=all)
+        if since and watermark:
+            raise CommandError('Use either --since or --watermark, not both.')
+        if workers < 1 or chunk_size < 1 or checkpoint_interval < 1:
+            raise CommandError('The number of workers, the chunk size and the checkpoint interval must be positive.')
+        if resume and not filepath:
+            raise CommandError('Only exports to a file (--file) can be resumed.')
+        if profile and workers > 1:
+            raise CommandError('Only exports with a single worker can be profiled.')
+
+        self.checkpoint_path = checkpoint or '%s.checkpoint' % credentials_filepath
+        # exports to standard output can't be resumed, so aren't checkpointed
+        self.checkpoint_interval = checkpoint_interval if filepath else None
+        state = self.load_checkpoint() if resume else None
+        if resume and (state is None or state['filepath'] != filepath or
+                       state['credentials_filepath'] != credentials_filepath):
+            raise CommandError('No checkpoint for this export in {0!r}.'.format(self.checkpoint_path))
+
+        if since:
+            since = self.parse_since(since)
+        elif watermark:
+            since = ExportWatermark.objects.filter(name=watermark).values_list('watermark', flat=True)
+            since = since[0] if since else None
+        if state is None:
+            # members changed while exporting are included in the next export
+            started = timezone.now()
+            self.state = {'filepath': filepath, 'credentials_filepath': credentials_filepath,
+                          'started': started.isoformat(), 'username': '', 'pk': None, 'record_number': 0}
+        else:
+            started = parse_datetime(state['started'])
+            self.state = state
+
+        members = self.get_members(include_all=all, since=since)
+        if resume:
+            members = members.filter(username__gt=state['username'])
         callback = None if password_callback is None else self.load_callback(password_callback)
+        self.chunk_size = chunk_size
+        self.profile = ExportProfile() if profile else None
+        # rejected records aren't checkpointed, so they may be repeated when resuming
+        self.rejects_output = None
+        if validate:
+            self.rejects_output = open(rejects or '%s.rejects' % credentials_filepath, 'ab' if resume else 'wb')
+
+        output = ExportFile(filepath, state and state['output_offset']) if filepath else self.stdout
+        try:
+            with ExportFile(credentials_filepath, state and state['credentials_offset']) as credentials_output:
+                if workers > 1:
+                    self.export_sharded(output, credentials_output, members, workers, password_callback,
+                                        pretty_print, path.dirname(path.abspath(credentials_filepath)), resume)
+                else:
+                    self.export(output, credentials_output, members, callback, pretty_print, resume)
+        finally:
+            if filepath:
+                output.close()
+            if self.rejects_output is not None:
+                self.rejects_output.close()
+        if filepath and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+        if self.profile is not None:
+            self.profile.finish()
+            self.stderr.write(self.profile.summary())
+            with open(profile, 'w') as f:
+                json.dump(self.profile.as_dict(), f, indent=2)
 
-        with open(filepath, 'w') if filepath else self.stdout as output:
-            with open(credentials_filepath, 'w') as credentials_output:
-                dataloadtool_export(output, credentials_output, members,
-                                    password_callback=callback, pretty_print=pretty_print)
+        if watermark:
+            # only move the watermark once the output is complete
+            with transaction.commit_on_success():
+                if not ExportWatermark.objects.filter(name=watermark).update(watermark=started):
+                    ExportWatermark.objects.create(name=watermark, watermark=started)
+
+    def export(self, output, credentials_output, members, password_callback, pretty_print, resume):
+        """
+        Export the members like `dataloadtool_export()`, checkpointing progress
+        when exporting to a file.
+        """
+        with etree.xmlfile(output) as xf:
+            checkpoint = None
+            if self.checkpoint_interval is not None:
+                def checkpoint(record_number, member):
+                    xf.flush()
+                    self.save_checkpoint(output, credentials_output, record_number, member.username, member.pk)
+
+            if resume:
+                # the root element's start tag was written before the first checkpoint
+                output.discard('<Consumers>')
+            with xf.element('Consumers'):
+                if not resume:
+                    xf.write('\n')
+                    if checkpoint is not None:
+                        xf.flush()
+                        self.save_checkpoint(output, credentials_output, 0, '', None)
+                dataloadtool_export_records(xf, credentials_output, members, password_callback=password_callback,
+                                            pretty_print=pretty_print, start=self.state['record_number'],
+                                            last_username=self.state['username'].lower(), checkpoint=checkpoint,
+                                            checkpoint_interval=self.checkpoint_interval, chunk_size=self.chunk_size,
+                                            reject=self.rejects_output and reject_writer(self.rejects_output),
+                                            profile=self.profile)
+        output.write('\n')
+
+    def export_sharded(self, output, credentials_output, members, workers, password_callback, pretty_print,
+                       parts_parent, resume):
+        """
+        Export the members in worker processes, each writing a contiguous
+        shard of the username ordering to part files in `parts_parent`, and
+        merge the parts in order as they are completed, checkpointing after
+        each part.
+        """
+        # members that join during the export are left for the next export, so that the shards stay as planned
+        max_pk = members.aggregate(max_pk=Max('pk'))['max_pk']
+        if max_pk is not None:
+            members = members.filter(pk__lte=max_pk)
+        # continue the record numbers and duplicate username resolution of a resumed export
+        shards = [(self.state['record_number'] + start, first, previous or self.state['username'])
+                  for start, first, previous in plan_shards(members, workers)]
+
+        parts_dir = tempfile.mkdtemp(prefix='dataloadtool', dir=parts_parent)
+        tasks = []
+        for n, (start, first, previous) in enumerate(shards):
+            upper = shards[n + 1][1] if n + 1 < len(shards) else None
+            tasks.append((members.query, start, first, upper, previous, path.join(parts_dir, '%d.xml' % n),
+                          path.join(parts_dir, '%d.csv' % n),
+                          None if self.rejects_output is None else path.join(parts_dir, '%d.rejects' % n),
+                          password_callback, pretty_print, self.chunk_size))
+
+        # worker processes must not share the parent's database connection
+        connection.close()
+        pool = Pool(workers)
+        try:
+            if not resume:
+                output.write('<Consumers>\n')
+                if self.checkpoint_interval is not None:
+                    self.save_checkpoint(output, credentials_output, self.state['record_number'], '', None)
+            for n, (xml_path, csv_path, rejects_path) in enumerate(pool.imap(export_shard, tasks)):
+                copy_part(xml_path, output)
+                with open(csv_path, 'rb') as part:
+                    shutil.copyfileobj(part, credentials_output)
+                os.remove(xml_path)
+                os.remove(csv_path)
+                if rejects_path is not None:
+                    with open(rejects_path, 'rb') as part:
+                        shutil.copyfileobj(part, self.rejects_output)
+                    os.remove(rejects_path)
+                if self.checkpoint_interval is not None and n + 1 < len(shards):
+                    start, first, previous = shards[n + 1]
+                    self.save_checkpoint(output, credentials_output, start, previous, None)
+            output.write('</Consumers>\n')
+        finally:
+            pool.close()
+            pool.join()
+            shutil.rmtree(parts_dir, ignore_errors=True)
+
+    def parse_since(self, since):
+        """
+        Parse the --since date or time, or raise an appropriate CommandError.
+        """
+        value = parse_datetime(since)
+        if value is None:
+            date = parse_date(since)
+            if date is None:
+                raise CommandError('Invalid --since date or time {0!r}.'.format(since))
+            value = datetime.datetime.combine(date, datetime.time())
+        if settings.USE_TZ and timezone.is_naive(value):
+            value = timezone.make_aware(value, timezone.get_default_timezone())
+        return value
 
     def load_callback(self, password_callback):
         """
@@ -70,8 +456,38 @@ class Command(NoArgsCommand):
             raise CommandError('Provided password callback is not callable: {0!r}'.format(callback))
         return callback
 
-    def get_members(self, include_all=False):
+    def load_checkpoint(self):
+        if not os.path.exists(self.checkpoint_path):
+            return None
+        try:
+            with open(self.checkpoint_path) as f:
+                return json.load(f)
+        except ValueError as e:
+            raise CommandError('Invalid checkpoint file {0!r}: {1}'.format(self.checkpoint_path, e))
+
+    def save_checkpoint(self, output, credentials_output, record_number, username, pk):
+        """
+        Checkpoint the output files and record the next recordNumber and the
+        last member exported.
+        """
+        self.state.update({
+            'record_number': record_number,
+            'username': username,
+            'pk': pk,
+            'output_offset': output.checkpoint(),
+            'credentials_offset': credentials_output.checkpoint(),
+        })
+        # write to a temporary file first so that the checkpoint is never truncated
+        tmp_path = '%s.tmp' % self.checkpoint_path
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f)
+        os.rename(tmp_path, self.checkpoint_path)
+
+    def get_members(self, include_all=False, since=None):
         """
         Return the members to export.
         """
-        return Member.objects.all() if include_all else Member.objects.filter(neoprofile__isnull=True)
+        members = Member.objects.all() if include_all else Member.objects.filter(neoprofile__isnull=True)
+        if since is not None:
+            members = members.filter(Q(date_joined__gte=since) | Q(neomirror__modified__gte=since))
+        return members
@@ -0,0 +1,50 @@
+from optparse import make_option
+from textwrap import dedent
+
+from django.core.management.base import NoArgsCommand, CommandError
+from django.db import transaction
+
+from neo.models import Member, NEO_ATTR, sync_neo_mirror
+from neo.utils import Progress, keyset_iterator
+
+
+class Command(NoArgsCommand):
+    help = dedent("""\
+        Create the NeoMirror of members that don't have one yet.
+
+        Mirrors are otherwise only written when members are saved, so this
+        should be run once after upgrading, and `neo_filter` queries leave out
+        members without one.
+        Without USE_MCAL, members whose attributes aren't cached are fetched
+        from Neo.""")
+
+    option_list = list(NoArgsCommand.option_list) + [
+        make_option('-b', '--batch-size', dest='batch_size', type='int', default=500,
+                    help='Number of members to fetch and mirror per transaction (default: 500).'),
+        make_option('--all', dest='refresh', action='store_true', default=False,
+                    help='Also refresh the existing mirrors.'),
+    ]
+
+    def handle(self, batch_size=500, refresh=False, **options):
+        if batch_size < 1:
+            raise CommandError('The batch size must be positive.')
+        members = Member.objects.select_related('country')
+        if not refresh:
+            members = members.filter(neomirror__isnull=True)
+        progress = Progress(members.count(), self.stdout, verb='Mirrored')
+
+        batch = []
+        for member in keyset_iterator(members, ('pk',), batch_size):
+            batch.append(member)
+            if len(batch) == batch_size:
+                self.mirror_batch(batch, progress)
+                batch = []
+        if batch:
+            self.mirror_batch(batch, progress)
+        progress.finish()
+
+    def mirror_batch(self, batch, progress):
+        with transaction.commit_on_success():
+            for member in batch:
+                sync_neo_mirror(member.pk, dict((k, getattr(member, k)) for k in NEO_ATTR))
+        progress.update(len(batch))
@@ -0,0 +1,167 @@
+import csv
+from itertools import islice
+from optparse import make_option
+from textwrap import dedent
+
+from django.core.management.base import NoArgsCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
+
+from neo.models import Member, NeoProfile, BULK_CHUNK_SIZE, save_neoprofiles
+from neo.utils import open_export_file
+
+
+def read_results(results_file, login_column, consumer_id_column):
+    """
+    Read the consumer ids from a Data Load Tool results CSV file.
+
+    :return: A dict of lowercase login aliases to consumer ids, and a list of
+        the login aliases with more than one consumer id.
+    """
+    reader = csv.reader(results_file)
+    try:
+        header = [name.strip().lower() for name in reader.next()]
+    except StopIteration:
+        return {}, []
+    try:
+        login_index = header.index(login_column.lower())
+        consumer_id_index = header.index(consumer_id_column.lower())
+    except ValueError:
+        raise CommandError('The results file needs {0!r} and {1!r} columns.'.format(login_column,
+                                                                                  consumer_id_column))
+    consumer_ids = {}
+    duplicates = set()
+    for row in reader:
+        if not row:
+            continue
+        login_alias = row[login_index].strip().lower()
+        try:
+            consumer_id = int(row[consumer_id_index])
+        except ValueError:
+            # consumers the Data Load Tool failed to load have no id
+            continue
+        if consumer_ids.setdefault(login_alias, consumer_id) != consumer_id:
+            duplicates.add(login_alias)
+    for login_alias in duplicates:
+        del consumer_ids[login_alias]
+    return consumer_ids, sorted(duplicates)
+
+
+class Command(NoArgsCommand):
+    help = dedent("""\
+        Create NeoProfiles for members exported with members_to_cidb_dataloadtool.
+
+        The consumer ids in the Data Load Tool results CSV file are joined on
+        login alias with the rows of the credentials file written by the
+        export (username, login_alias, password, without a header). The
+        results are read into memory, and the credentials are streamed and
+        imported in chunks, with a transaction per chunk.
+
+        The login aliases and passwords of existing NeoProfiles of the same
+        members are updated. Rows with a consumer id or login alias that
+        belongs to another member's NeoProfile, or for a member whose
+        NeoProfile has another consumer id, are skipped and reported as
+        conflicts.
+
+        Usage: neo_import_dataloadtool_results results_filepath credentials_filepath [options]""")
+
+    option_list = list(NoArgsCommand.option_list) + [
+        make_option('--login-column', dest='login_column', default='LoginName',
+                    help='Name of the login alias column in the results file (default: LoginName).'),
+        make_option('--consumer-id-column', dest='consumer_id_column', default='ConsumerID',
+                    help='Name of the consumer id column in the results file (default: ConsumerID).'),
+        make_option('-b', '--batch-size', dest='batch_size', type='int', default=BULK_CHUNK_SIZE,
+                    help='Number of credentials to import per transaction (default: %d).' % BULK_CHUNK_SIZE),
+    ]
+
+    def handle(self, results_filepath, credentials_filepath, login_column='LoginName',
+               consumer_id_column='ConsumerID', batch_size=BULK_CHUNK_SIZE, **options):
+        if batch_size < 1:
+            raise CommandError('The batch size must be positive.')
+
+        with open_export_file(results_filepath) as results_file:
+            consumer_ids, duplicates = read_results(results_file, login_column, consumer_id_column)
+        for login_alias in duplicates:
+            self.stderr.write("Skipped %s: more than one consumer id in the results\n" % login_alias)
+
+        self.counts = dict.fromkeys(('created', 'updated', 'unchanged', 'conflict', 'missing_member',
+                                     'not_loaded', 'failed'), 0)
+        self.counts['conflict'] = len(duplicates)
+        with open_export_file(credentials_filepath) as credentials_file:
+            rows = csv.reader(credentials_file)
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                self.import_batch(batch, consumer_ids)
+
+        self.stderr.write("Imported %s\n" % ', '.join(
+            '%d %s' % (self.counts[k], k) for k in ('created', 'updated', 'unchanged', 'conflict',
+                                                   'missing_member', 'not_loaded', 'failed')))
+
+    def import_batch(self, batch, consumer_ids):
+        """
+        Create or update the NeoProfiles for a batch of (username, login_alias,
+        password) credentials rows.
+        """
+        rows = []
+        for username, login_alias, password in batch:
+            login_alias = login_alias.lower()
+            consumer_id = consumer_ids.get(login_alias)
+            if consumer_id is None:
+                self.counts['not_loaded'] += 1
+            else:
+                rows.append((username.decode('utf-8'), login_alias.decode('utf-8'), password.decode('utf-8'),
+                             consumer_id))
+        if not rows:
+            return
+
+        user_ids = dict(Member.objects.filter(username__in=[r[0] for r in rows]).values_list('username', 'pk'))
+        existing = NeoProfile.objects.filter(
+            Q(user__in=user_ids.values()) | Q(consumer_id__in=[r[3] for r in rows]) |
+            Q(login_alias__in=[r[1] for r in rows])).values_list('consumer_id', 'user', 'login_alias', 'password')
+        by_user = dict((p[1], p) for p in existing)
+        user_by_consumer_id = dict((p[0], p[1]) for p in existing)
+        user_by_login_alias = dict((p[2], p[1]) for p in existing)
+
+        new = []
+        updates = []
+        for username, login_alias, password, consumer_id in rows:
+            user_id = user_ids.get(username)
+            if user_id is None:
+                self.counts['missing_member'] += 1
+                self.stderr.write("Skipped %s: no member with username %s\n" % (login_alias, username))
+            elif user_by_consumer_id.get(consumer_id, user_id) != user_id:
+                self.counts['conflict'] += 1
+                self.stderr.write("Skipped %s: consumer id %d belongs to user %d\n"
+                                  % (login_alias, consumer_id, user_by_consumer_id[consumer_id]))
+            elif user_by_login_alias.get(login_alias, user_id) != user_id:
+                self.counts['conflict'] += 1
+                self.stderr.write("Skipped %s: login alias belongs to user %d\n"
+                                  % (login_alias, user_by_login_alias[login_alias]))
+            elif user_id in by_user and by_user[user_id][0] != consumer_id:
+                # the consumer id is the NeoProfile's primary key, so don't re-key it
+                self.counts['conflict'] += 1
+                self.stderr.write("Skipped %s: user %d has consumer id %d\n"
+                                  % (login_alias, user_id, by_user[user_id][0]))
+            elif user_id in by_user:
+                if by_user[user_id] == (consumer_id, user_id, login_alias, password):
+                    self.counts['unchanged'] += 1
+                else:
+                    updates.append((consumer_id, login_alias, password))
+            else:
+                # bulk_create skips NeoProfile.save, which lowercases the login alias
+                new.append(NeoProfile(user_id=user_id, consumer_id=consumer_id, login_alias=login_alias,
+                                      password=password))
+
+        if updates:
+            with transaction.commit_on_success():
+                for consumer_id, login_alias, password in updates:
+                    NeoProfile.objects.filter(pk=consumer_id).update(login_alias=login_alias, password=password)
+            self.counts['updated'] += len(updates)
+        if new:
+            saved, failures = save_neoprofiles(new)
+            self.counts['created'] += len(saved)
+            self.counts['failed'] += len(failures)
+            for user, e in failures:
+                self.stderr.write("Failed to create NeoProfile for user %d: %s\n" % (user.pk, e))
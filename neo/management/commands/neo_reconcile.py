@@ -0,0 +1,188 @@
+import json
+from optparse import make_option
+from textwrap import dedent
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+
+from django.core.management.base import NoArgsCommand, CommandError
+from django.core.cache import cache
+from django.db import connection
+
+from neo import api
+from neo.models import Member, NeoProfile, NEO_ATTR, USE_MCAL, update_consumer
+from neo.utils import ConsumerWrapper
+
+
+def normalize(key, value):
+    """
+    Return a JSON serializable value that compares equal for equivalent
+    local and Neo values.
+    """
+    if key == 'country':
+        return getattr(value, 'country_code', value)
+    if key == 'dob':
+        return value.isoformat() if value else None
+    if value == '':
+        return None
+    return value
+
+
+def neo_values(wrapper):
+    values = dict((k, normalize(k, getattr(wrapper, k))) for k in NEO_ATTR if k != 'country')
+    values['country'] = wrapper.country_code
+    return values
+
+
+def diff(local, neo):
+    """
+    Return the NEO_ATTR fields that differ between the local and Neo values.
+    """
+    fields = {}
+    for k in NEO_ATTR:
+        local_val = normalize(k, local.get(k))
+        if local_val != neo[k]:
+            fields[k] = {'local': local_val, 'neo': neo[k]}
+    return fields
+
+
+def fetch_consumer(profile):
+    consumer_id, user_id, login_alias, password = profile
+    try:
+        consumer = api.get_consumer(consumer_id, username=login_alias, password=password)
+        return profile, ConsumerWrapper(consumer=consumer), None
+    except Exception, e:
+        return profile, None, e
+
+
+def reconcile_shard(args):
+    """
+    Compare the consumers of the NeoProfiles in a pk range with the local
+    member data and the member cache. The range has no end if `end` is None.
+
+    :return: A list of drift records.
+    """
+    start, end, workers, apply_changes = args
+    profiles = NeoProfile.objects.filter(pk__gte=start)
+    if end is not None:
+        profiles = profiles.filter(pk__lt=end)
+    profiles = list(profiles.order_by('pk').values_list('pk', 'user_id', 'login_alias', 'password'))
+    if not profiles:
+        return []
+    fields = list(NEO_ATTR.difference(['country'])) + ['country__country_code']
+    members = dict((m['id'], m) for m in Member.objects.filter(
+        id__in=[p[1] for p in profiles]).values('id', *fields))
+    for m in members.itervalues():
+        m['country'] = m.pop('country__country_code')
+
+    records = []
+    existing = []
+    for profile in profiles:
+        if profile[1] in members:
+            existing.append(profile)
+        else:
+            records.append({'type': 'orphan', 'consumer_id': profile[0], 'user_id': profile[1]})
+
+    pool = ThreadPool(workers)
+    try:
+        results = pool.map(fetch_consumer, existing)
+    finally:
+        pool.close()
+        pool.join()
+
+    for (consumer_id, user_id, login_alias, password), wrapper, e in results:
+        if e is not None:
+            records.append({'type': 'missing', 'consumer_id': consumer_id, 'user_id': user_id,
+                            'error': str(e)})
+            continue
+        neo = neo_values(wrapper)
+        cache_key = 'neo_consumer_%s' % user_id
+        # with MCAL all member fields are stored in our database
+        mismatched = diff(members[user_id], neo) if USE_MCAL else {}
+        if mismatched:
+            records.append({'type': 'mismatch', 'consumer_id': consumer_id, 'user_id': user_id,
+                            'fields': mismatched})
+        cached = cache.get(cache_key, None)
+        stale = diff(cached, neo) if cached is not None else {}
+        if stale:
+            records.append({'type': 'stale_cache', 'consumer_id': consumer_id, 'user_id': user_id,
+                            'fields': stale})
+
+        if apply_changes and (mismatched or stale):
+            if mismatched:
+                # our database is the source of truth - push the local values to Neo
+                old_member = dict((k, getattr(wrapper, k)) for k in NEO_ATTR)
+                old_member.update(wrapper.address)
+                update_consumer(Member.objects.get(pk=user_id), old_member=old_member)
+            cache.delete(cache_key)
+    return records
+
+
+def plan_shards(shard_size):
+    """
+    Split the NeoProfiles into pk ranges of `shard_size` profiles. Neo
+    assigns the consumer ids, so the boundaries are read from the profiles.
+
+    :return: A list of (start, end) pk ranges, where the last end is None.
+    """
+    pks = NeoProfile.objects.order_by('pk').values_list('pk', flat=True)
+    starts = list(pks[:1])
+    if not starts:
+        return []
+    while True:
+        following = list(pks.filter(pk__gt=starts[-1])[shard_size - 1:shard_size])
+        if not following:
+            break
+        starts.append(following[0])
+    return zip(starts, starts[1:] + [None])
+
+
+class Command(NoArgsCommand):
+    help = dedent("""\
+        Detect drift between members and their CIDB consumers.
+
+        NeoProfiles are split into pk ranges that are reconciled in parallel
+        worker processes. Drift is written as JSON lines, one record per
+        orphan profile (no member), missing consumer (can't be fetched),
+        mismatched NEO_ATTR fields and stale member cache entries.
+
+        With --apply, local values are pushed to Neo for mismatched fields
+        (with USE_MCAL) and stale cache entries are cleared. Orphans and
+        missing consumers are only reported.""")
+
+    option_list = list(NoArgsCommand.option_list) + [
+        make_option('-f', '--file', dest='filepath', help='Output file (default: standard output)', metavar='FILE'),
+        make_option('-p', '--processes', dest='processes', type='int', default=4,
+                    help='Number of worker processes (default: 4).'),
+        make_option('-w', '--workers', dest='workers', type='int', default=8,
+                    help='Number of concurrent Neo requests per process (default: 8).'),
+        make_option('-s', '--shard-size', dest='shard_size', type='int', default=1000,
+                    help='Number of NeoProfiles handled by a worker at a time (default: 1000).'),
+        make_option('--apply', dest='apply_changes', action='store_true', default=False,
+                    help='Fix mismatched fields and stale cache entries.'),
+    ]
+
+    def handle(self, filepath=None, processes=4, workers=8, shard_size=1000, apply_changes=False, **options):
+        if processes < 1 or workers < 1 or shard_size < 1:
+            raise CommandError('The number of processes and workers and the shard size must be positive.')
+        shards = [(start, end, workers, apply_changes) for start, end in plan_shards(shard_size)]
+
+        counts = {}
+        # worker processes must not share the parent's database connection
+        connection.close()
+        pool = Pool(processes)
+        output = open(filepath, 'w') if filepath else self.stdout
+        try:
+            for records in pool.imap(reconcile_shard, shards):
+                for record in records:
+                    counts[record['type']] = counts.get(record['type'], 0) + 1
+                    output.write(json.dumps(record))
+                    output.write('\n')
+        finally:
+            if filepath:
+                output.close()
+            pool.close()
+            pool.join()
+
+        summary = ', '.join('%d %s' % (counts.get(t, 0), t)
+                            for t in ('orphan', 'missing', 'mismatch', 'stale_cache'))
+        self.stderr.write("Reconciled %d shards: %s\n" % (len(shards), summary))
@@ -0,0 +1,121 @@
+import os
+import json
+from itertools import islice
+from optparse import make_option
+from textwrap import dedent
+from multiprocessing.pool import ThreadPool
+
+from django.core.management.base import NoArgsCommand, CommandError
+from django.db import transaction
+
+from neo.models import NeoProfile
+from neo.utils import RateLimiter, Progress, keyset_iterator
+
+
+class Command(NoArgsCommand):
+    help = dedent("""\
+        Rotate the Neo passwords of all NeoProfiles.
+
+        Progress is checkpointed after every batch, so an interrupted run
+        continues where it stopped when the command is run again.
+        Profiles that failed are retried on the next run.""")
+
+    option_list = list(NoArgsCommand.option_list) + [
+        make_option('-w', '--workers', dest='workers', type='int', default=8,
+                    help='Number of concurrent Neo requests (default: 8).'),
+        make_option('-r', '--rate', dest='rate', type='float', default=0,
+                    help='Maximum number of profiles to rotate per second (default: no limit).'),
+        make_option('-b', '--batch-size', dest='batch_size', type='int', default=100,
+                    help='Number of profiles to rotate between database writes and checkpoints (default: 100).'),
+        make_option('-c', '--checkpoint', dest='checkpoint', default='neo_rotate_passwords.checkpoint',
+                    help='Checkpoint file (default: neo_rotate_passwords.checkpoint).', metavar='FILE'),
+        make_option('--restart', dest='restart', action='store_true', default=False,
+                    help='Ignore an existing checkpoint and rotate all passwords.'),
+    ]
+
+    def handle(self, workers=8, rate=0, batch_size=100, checkpoint='neo_rotate_passwords.checkpoint',
+               restart=False, **options):
+        if workers < 1 or batch_size < 1:
+            raise CommandError('The number of workers and the batch size must be positive.')
+        self.checkpoint_path = checkpoint
+        state = {'last_pk': None, 'failed': []} if restart else self.load_checkpoint()
+        self.limiter = RateLimiter(rate)
+
+        remaining = NeoProfile.objects.all()
+        if state['last_pk'] is not None:
+            remaining = remaining.filter(pk__gt=state['last_pk'])
+        retry = list(NeoProfile.objects.filter(pk__in=state['failed']).values_list('pk', 'login_alias'))
+        progress = Progress(remaining.count() + len(retry), self.stdout, verb='Rotated')
+
+        pool = ThreadPool(workers)
+        try:
+            # retry the profiles that failed on the previous run first
+            failed = []
+            for i in range(0, len(retry), batch_size):
+                failed.extend(self.rotate_batch(pool, retry[i:i + batch_size], progress))
+            state['failed'] = failed
+            self.save_checkpoint(state)
+
+            profiles = keyset_iterator(remaining.only('login_alias'), ('pk',), batch_size)
+            while True:
+                batch = [(p.pk, p.login_alias) for p in islice(profiles, batch_size)]
+                if not batch:
+                    break
+                state['failed'].extend(self.rotate_batch(pool, batch, progress))
+                state['last_pk'] = batch[-1][0]
+                self.save_checkpoint(state)
+        finally:
+            pool.close()
+            pool.join()
+        progress.finish()
+
+        if state['failed']:
+            self.stderr.write("Failed to rotate %d passwords, run the command again to retry them.\n"
+                              % len(state['failed']))
+
+    def rotate(self, profile):
+        pk, login_alias = profile
+        self.limiter.wait()
+        password = NeoProfile.generate_password()
+        try:
+            NeoProfile.change_neo_password(login_alias, password)
+        except Exception, e:
+            return pk, None, e
+        return pk, password, None
+
+    def rotate_batch(self, pool, batch, progress):
+        """
+        Rotate the passwords of a batch of (pk, login_alias) tuples concurrently,
+        and store the new passwords in a single transaction.
+
+        :return: The pks of the profiles that failed.
+        """
+        results = pool.map(self.rotate, batch)
+        failed = []
+        with transaction.commit_on_success():
+            for pk, password, e in results:
+                if e is None:
+                    NeoProfile.objects.filter(pk=pk).update(password=password)
+                else:
+                    failed.append(pk)
+        for pk, password, e in results:
+            if e is not None:
+                self.stderr.write("\nFailed to rotate password for NeoProfile %s: %s\n" % (pk, e))
+        progress.update(len(batch))
+        return failed
+
+    def load_checkpoint(self):
+        if not os.path.exists(self.checkpoint_path):
+            return {'last_pk': None, 'failed': []}
+        try:
+            with open(self.checkpoint_path) as f:
+                return json.load(f)
+        except ValueError as e:
+            raise CommandError('Invalid checkpoint file {0!r}: {1}'.format(self.checkpoint_path, e))
+
+    def save_checkpoint(self, state):
+        # write to a temporary file first so that the checkpoint is never truncated
+        tmp_path = '%s.tmp' % self.checkpoint_path
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.rename(tmp_path, self.checkpoint_path)
@@ -0,0 +1,49 @@
+import threading
+
+from django.conf import settings
+
+from neo.budget import neo_budget
+
+
+# The budget of the request being handled by the current thread
+_current = threading.local()
+
+
+class NeoBudgetMiddleware(object):
+    '''
+    Counts the Neo calls made by each request, logging a warning or raising
+    `NeoBudgetExceeded` when a request is over the budget set with the
+    `REQUEST_MAX_CALLS` and `REQUEST_MAX_TIME` settings.
+    With DEBUG enabled, the counts are added to the response headers.
+    '''
+
+    def process_request(self, request):
+        # the previous request's budget is still active if its response didn't
+        #   pass back through this middleware, e.g. a later middleware raised
+        stale = getattr(_current, 'budget', None)
+        if stale is not None:
+            stale.discard()
+        request.neo_budget = _current.budget = neo_budget(name=request.path)
+        request.neo_budget.__enter__()
+
+    def process_exception(self, request, exception):
+        budget = getattr(request, 'neo_budget', None)
+        if budget is not None:
+            del request.neo_budget
+            _current.budget = None
+            budget.discard()
+        return None
+
+    def process_response(self, request, response):
+        budget = getattr(request, 'neo_budget', None)
+        # process_request is skipped if an earlier middleware returned a response
+        if budget is None:
+            return response
+        del request.neo_budget
+        _current.budget = None
+        if settings.DEBUG:
+            response['X-Neo-Calls'] = str(budget.calls)
+            response['X-Neo-Cache-Lookups'] = str(budget.cache_lookups)
+            response['X-Neo-Time'] = '%.3f' % budget.time
+        budget.__exit__(None, None, None)
+        return response
@@ -1,27 +1,42 @@
+import atexit
+import logging
 import warnings
-from StringIO import StringIO
 import random
 import string
+import threading
+from functools import wraps
+from itertools import islice
+from operator import attrgetter
+from multiprocessing.pool import ThreadPool
 
-from lxml import etree, objectify
+from lxml import etree
 
-from django.db import models
+from django.db import models, transaction, connection, IntegrityError
 from django.contrib.auth.models import User
 from django.contrib.auth.signals import user_logged_out, user_logged_in
 from django.db.models import signals
+from django.db.models.query import QuerySet
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.conf import settings
 from django.contrib.auth.models import UserManager
+from django.utils.datastructures import SortedDict
+from django.utils import timezone
 
 from preferences import preferences
-from foundry.models import Member, DefaultAvatar
+from foundry.models import Member, DefaultAvatar, Country
 
 from neo import api
-from neo.utils import ConsumerWrapper, normalize_username
+from neo.dispatch import NotificationDispatcher
+from neo.budget import record_cache_lookup
+from neo.utils import ConsumerWrapper, normalize_username, gds_to_etree, keyset_iterator, \
+    dataloadtool_schema, consumer_member_dict
 from neo.constants import modify_flag
 
 
+logger = logging.getLogger(__name__)
+
+
 class NeoProfile(models.Model):
     user = models.OneToOneField(User)
     # the Neo consumer id used in API requests
@@ -48,13 +63,21 @@ class NeoProfile(models.Model):
         """
         return ''.join(random.choice(chars) for _ in range(length))
 
+    @staticmethod
+    def change_neo_password(login_alias, password):
+        '''
+        Set the consumer's password on Neo using a forgot password token,
+        so the current password isn't needed
+        '''
+        api.change_password(login_alias, password,
+                            token=api.get_forgot_password_token(login_alias).TempToken)
+
     def reset_password(self, new_password=None):
         if new_password:
             self.password = new_password
         else:
             self.password = NeoProfile.generate_password()
-        api.change_password(self.login_alias, new_password,
-                            token=api.get_forgot_password_token(self.login_alias).TempToken)
+        NeoProfile.change_neo_password(self.login_alias, self.password)
         self.save()
 
     def save(self, *args, **kwargs):
@@ -65,14 +88,95 @@ class NeoProfile(models.Model):
         super(NeoProfile, self).save(*args, **kwargs)
 
 
+class NeoMirror(models.Model):
+    '''
+    A local copy of the member attributes that are stored on Neo, so that
+    members can be filtered and sorted on them in the database.
+    It is kept in sync when members are saved, and by the neo_backfill_mirror command.
+    '''
+    user = models.OneToOneField(User, primary_key=True)
+    first_name = models.CharField(max_length=30, null=True, db_index=True)
+    last_name = models.CharField(max_length=30, null=True, db_index=True)
+    email = models.CharField(max_length=75, null=True, db_index=True)
+    mobile_number = models.CharField(max_length=64, null=True, db_index=True)
+    dob = models.DateField(null=True, db_index=True)
+    gender = models.CharField(max_length=1, null=True, db_index=True)
+    country_code = models.CharField(max_length=2, null=True, db_index=True)
+    # when the member was last saved by us (null if only ever backfilled)
+    modified = models.DateTimeField(null=True, db_index=True)
+
+
+class ExportWatermark(models.Model):
+    '''
+    The time up to which members have been exported by incremental
+    `members_to_cidb_dataloadtool` runs with the given name
+    '''
+    name = models.CharField(max_length=50, unique=True)
+    watermark = models.DateTimeField()
+
+
+# Member fields that are mirrored by NeoMirror (country is stored as country_code)
+MIRROR_FIELDS = frozenset((
+    'first_name', 'last_name', 'email', 'mobile_number',
+    'dob', 'gender', 'country_code'))
+
+
+def _mirror_lookups(lookups):
+    '''
+    Prefix lookups on mirrored fields so that they span the NeoMirror relation
+    '''
+    prefixed = {}
+    for key, value in lookups.iteritems():
+        if key.split('__', 1)[0] in MIRROR_FIELDS:
+            key = 'neomirror__%s' % key
+        prefixed[key] = value
+    return prefixed
+
+
+def _mirror_ordering(fields):
+    ordering = []
+    for field in fields:
+        desc = field.startswith('-')
+        name = field.lstrip('-')
+        if name in MIRROR_FIELDS:
+            name = 'neomirror__%s' % name
+        ordering.append('%s%s' % ('-' if desc else '', name))
+    return ordering
+
+
+class NeoMemberQuerySet(QuerySet):
+    '''
+    Adds filtering and sorting on the Neo attributes, which aren't stored on
+    Member, using NeoMirror
+    '''
+
+    def neo_filter(self, *args, **kwargs):
+        return self.filter(*args, **_mirror_lookups(kwargs))
+
+    def neo_exclude(self, *args, **kwargs):
+        return self.exclude(*args, **_mirror_lookups(kwargs))
+
+    def neo_order_by(self, *fields):
+        return self.order_by(*_mirror_ordering(fields))
+
+
 class NeoMemberManager(UserManager):
     def get_query_set(self):
         '''
         Selects NeoProfile along with Member to avoid an inevitable second query
         '''
-        qs = super(NeoMemberManager, self).get_query_set()
+        qs = NeoMemberQuerySet(self.model, using=self._db)
         return qs.select_related('neoprofile')
 
+    def neo_filter(self, *args, **kwargs):
+        return self.get_query_set().neo_filter(*args, **kwargs)
+
+    def neo_exclude(self, *args, **kwargs):
+        return self.get_query_set().neo_exclude(*args, **kwargs)
+
+    def neo_order_by(self, *fields):
+        return self.get_query_set().neo_order_by(*fields)
+
 
 '''
 The member attributes that are stored on Neo and in memcached
@@ -91,15 +195,74 @@ ADDRESS_FIELDS = frozenset(('city', 'country', 'province', 'zipcode', 'address')
 # These fields correspond to the available login fields in jmbo-foundry
 JMBO_REQUIRED_FIELDS = frozenset(('username', 'mobile_number', 'email'))
 
+
+def _cleared_value(field):
+    '''
+    Return a function giving the value a stashed field is cleared to.
+    If field can be null, set to None. Otherwise assign
+    a default value. If a default value has not been
+    specified, assign the default of the python type
+    '''
+    if field.null:
+        return lambda value: None
+    elif field.default != models.fields.NOT_PROVIDED:
+        return lambda value: field.default
+    return lambda value: type(value)()
+
+
+'''
+Mappings between Member and ConsumerWrapper attributes, built once at import
+'''
+# (name, member getter, wrapper setter) for each of the Neo attributes
+NEO_FIELD_MAP = tuple((k, attrgetter(k), getattr(ConsumerWrapper, 'set_%s' % k)) for k in NEO_ATTR)
+
+# (name, member getter, cleared value) for the fields that aren't stored in our db without MCAL
+STASH_FIELD_MAP = tuple((k, attrgetter(k), _cleared_value(Member._meta.get_field(k)))
+                        for k in NEO_ATTR.union(ADDRESS_FIELDS).difference(JMBO_REQUIRED_FIELDS))
+
+# The address fields in the order that ConsumerWrapper.set_address takes them
+ADDRESS_ARGS = ('address', 'city', 'province', 'zipcode', 'country')
+get_address = attrgetter(*ADDRESS_ARGS)
+
+# (name, attname) for the member fields that are diffed on save, e.g. ('country', 'country_id')
+SNAPSHOT_FIELDS = tuple((k, Member._meta.get_field(k).attname) for k in NEO_ATTR.union(ADDRESS_FIELDS))
+
 USE_MCAL = settings.NEO.get('USE_MCAL', False)
 
+# The maximum number of concurrent Neo requests when dispatching deferred updates
+SYNC_WORKERS = settings.NEO.get('SYNC_WORKERS', 4)
+
+# The number of NeoProfiles inserted per query when creating consumers in bulk
+BULK_CHUNK_SIZE = 500
+
+# The number of members fetched per query when exporting, in username order
+EXPORT_CHUNK_SIZE = 1000
+
+
+# Send login and logout notifications to Neo in the background, outside of the request
+ASYNC_NOTIFICATIONS = settings.NEO.get('ASYNC_NOTIFICATIONS', False)
+
+notification_dispatcher = NotificationDispatcher(
+    max_queue_size=settings.NEO.get('NOTIFICATION_QUEUE_SIZE', 1000))
+
+if ASYNC_NOTIFICATIONS:
+    # the background thread is a daemon thread, so send what is still queued when the process exits
+    atexit.register(notification_dispatcher.flush, settings.NEO.get('NOTIFICATION_FLUSH_TIMEOUT', 5.0))
+
+
+def notify(func, *args, **kwargs):
+    if ASYNC_NOTIFICATIONS:
+        notification_dispatcher.dispatch(func, *args, **kwargs)
+    else:
+        func(*args, **kwargs)
+
 
 def notify_logout(sender, **kwargs):
     try:
         # user_logged_out can be called without there being a logged in user
         neo_profile = kwargs['user'].neoprofile if kwargs['user'] else None
         if neo_profile:
-            api.logout(neo_profile.consumer_id)
+            notify(api.logout, neo_profile.consumer_id)
     except NeoProfile.DoesNotExist:
         pass  # figure out something to do here
 
@@ -110,7 +273,7 @@ def neo_login(sender, **kwargs):
         neo_profile = kwargs['user'].neoprofile
         # Authenticate via Neo in addition to Django
         if neo_profile:
-            api.authenticate(neo_profile.login_alias, neo_profile.password)
+            notify(api.authenticate, neo_profile.login_alias, neo_profile.password)
     except NeoProfile.DoesNotExist:
         pass
 
@@ -124,21 +287,10 @@ def stash_neo_fields(member, clear=False):
     Stash the neo fields that aren't required and clear
     them on the instance so that they aren't saved to db
     '''
-    for key in (NEO_ATTR.union(ADDRESS_FIELDS)).difference(JMBO_REQUIRED_FIELDS):
-        stashed_fields[key] = getattr(member, key)
-        '''
-        If field can be null, set to None. Otherwise assign
-        a default value. If a default value has not been
-        specified, assign the default of the python type
-        '''
-        field = Member._meta.get_field_by_name(key)[0]
+    for key, get_value, cleared_value in STASH_FIELD_MAP:
+        value = stashed_fields[key] = get_value(member)
         if clear:
-            if field.null:
-                setattr(member, key, None)
-            elif field.default != models.fields.NOT_PROVIDED:
-                setattr(member, key, field.default)
-            else:
-                setattr(member, key, type(stashed_fields[key])())
+            setattr(member, key, cleared_value(value))
     return stashed_fields
 
 
@@ -147,8 +299,8 @@ def wrap_member(member, login_alias=None, password=None):
     Return a `ConsumerWrapper` reflecting the given `Member`.
     """
     wrapper = ConsumerWrapper()
-    for a in NEO_ATTR:
-        getattr(wrapper, "set_%s" % a)(getattr(member, a))
+    for key, get_value, set_value in NEO_FIELD_MAP:
+        set_value(wrapper, get_value(member))
     # Use a login_alias instead if specified
     # member.username.lower() is not guaranteed to be unique
     if login_alias:
@@ -158,22 +310,26 @@ def wrap_member(member, login_alias=None, password=None):
         wrapper.set_password(password)
 
     # assign address
-    has_address = False
-    for k in ADDRESS_FIELDS:
-        if getattr(member, k, None):
-            has_address = True
-            break
-    if has_address:
-        wrapper.set_address(member.address, member.city,
-                            member.province, member.zipcode, member.country)
+    address = get_address(member)
+    if any(address):
+        wrapper.set_address(*address)
 
     return wrapper
 
 
 def create_consumer(member):
+    return _register_consumer(*_prepare_consumer(member))
+
+
+def _prepare_consumer(member):
+    # everything that may need the db, e.g. the member's country
     password = NeoProfile.generate_password()
     login_alias = normalize_username(member.username)
     wrapper = wrap_member(member, login_alias=login_alias, password=password)
+    return member, wrapper, login_alias, password
+
+
+def _register_consumer(member, wrapper, login_alias, password):
     consumer_id, uri = api.create_consumer(wrapper.consumer)
     api.complete_registration(consumer_id)  # activates the account
     # the NeoProfile needs to be saved elsewhere when member has been saved
@@ -181,51 +337,155 @@ def create_consumer(member):
                       password=password, login_alias=login_alias)
 
 
-def update_consumer(member):
-    consumer_id = member.neoprofile.consumer_id
-    # update changed attributes
-    old_member = cache.get('neo_consumer_%s' % member.pk, None)
-    wrapper = ConsumerWrapper()
-    if old_member is not None:  # it should never be None
-        for k in NEO_ATTR:
-            # check where cached version and current version of member differ
-            current = getattr(member, k, None)
-            old = old_member.get(k, None)
-            if current != old:
-                # update attribute on Neo
-                if old is None:
-                    getattr(wrapper, "set_%s" % k)(current, mod_flag=modify_flag['INSERT'])
-                elif current is None:
-                    getattr(wrapper, "set_%s" % k)(old, mod_flag=modify_flag['DELETE'])
+def _register_prepared_consumer(prepared):
+    try:
+        return prepared[0], _register_consumer(*prepared), None
+    except Exception, e:
+        return prepared[0], None, e
+
+
+def save_neoprofiles(profiles):
+    '''
+    Insert the NeoProfiles in a single query, falling back to saving them
+    one by one to isolate failures. Returns the saved NeoProfiles and the
+    failed (member, exception) tuples.
+    '''
+    try:
+        with transaction.commit_on_success():
+            NeoProfile.objects.bulk_create(profiles)
+        return profiles, []
+    except Exception:
+        pass
+    saved = []
+    failures = []
+    for profile in profiles:
+        try:
+            with transaction.commit_on_success():
+                profile.save()
+            saved.append(profile)
+        except Exception, e:
+            failures.append((profile.user, e))
+    return saved, failures
+
+
+def bulk_create_consumers(members, workers=SYNC_WORKERS, chunk_size=BULK_CHUNK_SIZE):
+    '''
+    Create consumers for saved members that don't have NeoProfiles yet.
+
+    Registrations are pipelined across a pool of `workers` threads and the
+    NeoProfiles are inserted with `bulk_create`, `chunk_size` at a time.
+    A failure for one member doesn't stop the others. The consumers are
+    built from the members in this thread, so pass a queryset with
+    `select_related('country')` to avoid a query per member.
+
+    Returns a tuple of the created NeoProfiles and a list of
+    (member, exception) tuples for the members that failed.
+    '''
+    created = []
+    failures = []
+    members = iter(members)
+    pool = ThreadPool(workers)
+    try:
+        while True:
+            # members are read and wrapped in this thread to keep db access out of the pool
+            chunk = [_prepare_consumer(member) for member in islice(members, chunk_size)]
+            if not chunk:
+                break
+            profiles = []
+            for member, profile, e in pool.imap_unordered(_register_prepared_consumer, chunk):
+                if e is None:
+                    profiles.append(profile)
                 else:
-                    getattr(wrapper, "set_%s" % k)(current, mod_flag=modify_flag['UPDATE'])
-
-        # check if address needs to change
-        has_address = False
-        had_address = False
-        address_changed = False
-        for k in ADDRESS_FIELDS:
-            current = getattr(member, k, None)
-            old = old_member.get(k, None)
-            if current:
-                has_address = True
-            if old:
-                had_address = True
-            if current != old:
-                address_changed = True
-        # update address accordingly
-        if address_changed:
-            if not has_address:
-                wrapper.set_address(old_member.address, old_member.city,
-                                    old_member.province, old_member.zipcode, old_member.country,
-                                    modify_flag['DELETE'])
-            elif not had_address:
-                wrapper.set_address(member.address, member.city,
-                                    member.province, member.zipcode, member.country)
+                    failures.append((member, e))
+            if profiles:
+                saved, failed = save_neoprofiles(profiles)
+                created.extend(saved)
+                failures.extend(failed)
+    finally:
+        pool.close()
+        pool.join()
+    return created, failures
+
+
+def diff_member(member, old_member):
+    '''
+    Return a `ConsumerWrapper` with the changes between the old member
+    attributes (a dict) and the current member
+    '''
+    wrapper = ConsumerWrapper()
+    for key, get_value, set_value in NEO_FIELD_MAP:
+        # check where cached version and current version of member differ
+        current = get_value(member)
+        old = old_member.get(key, None)
+        if current != old:
+            # update attribute on Neo
+            if old is None:
+                set_value(wrapper, current, mod_flag=modify_flag['INSERT'])
+            elif current is None:
+                set_value(wrapper, old, mod_flag=modify_flag['DELETE'])
             else:
-                wrapper.set_address(member.address, member.city,
-                                    member.province, member.zipcode, member.country,
-                                    mod_flag=modify_flag['UPDATE'])
+                set_value(wrapper, current, mod_flag=modify_flag['UPDATE'])
+
+    # check if address needs to change and update it accordingly
+    address = get_address(member)
+    old_address = tuple(old_member.get(k, None) for k in ADDRESS_ARGS)
+    if address != old_address:
+        if not any(address):
+            wrapper.set_address(*old_address, mod_flag=modify_flag['DELETE'])
+        elif not any(old_address):
+            wrapper.set_address(*address)
+        else:
+            wrapper.set_address(*address, mod_flag=modify_flag['UPDATE'])
+    return wrapper
+
+
+def capture_init_values(member):
+    '''
+    Store the raw values of the diffed fields on the member, as read from
+    the db. Foreign keys are stored as ids, so this doesn't hit the db.
+    '''
+    values = member.__dict__
+    try:
+        member._neo_init_values = dict((k, values[attname]) for k, attname in SNAPSHOT_FIELDS)
+    except KeyError:
+        # deferred fields haven't been loaded
+        member._neo_init_values = None
+
+
+def member_snapshot(member):
+    '''
+    Return the member attributes (a dict) as they were last synced with Neo
+    '''
+    init_values = None
+    if USE_MCAL:
+        init_values = getattr(member, '_neo_init_values', None)
+        if init_values is None and member.pk:
+            # the member was loaded with deferred fields - read them from the db before it is saved
+            rows = Member.objects.filter(pk=member.pk).values_list(*[attname for k, attname in SNAPSHOT_FIELDS])
+            if rows:
+                init_values = dict(zip([k for k, attname in SNAPSHOT_FIELDS], rows[0]))
+    if init_values is None:
+        record_cache_lookup()
+        return cache.get('neo_consumer_%s' % member.pk, None)
+    snapshot = dict(init_values)
+    country_id = snapshot['country']
+    if country_id is None:
+        snapshot['country'] = None
+    elif country_id == member.country_id:
+        snapshot['country'] = member.country
+    else:
+        snapshot['country'] = Country.objects.get(pk=country_id)
+    return snapshot
+
+
+def update_consumer(member, old_member=None):
+    consumer_id = member.neoprofile.consumer_id
+    # update changed attributes
+    if old_member is None:
+        old_member = member_snapshot(member)
+    if old_member is None:  # it should never be None
+        return
+    wrapper = diff_member(member, old_member)
 
     if not wrapper.is_empty:
         if not wrapper.profile_is_empty:
@@ -234,6 +494,139 @@ def update_consumer(member):
         api.update_consumer(consumer_id, wrapper.consumer, username=member.neoprofile.login_alias, password=member.neoprofile.password)
 
 
+class _DeferredSyncState(threading.local):
+    '''
+    Per-thread stack of the active `deferred_neo_sync` blocks, each with
+    the pending consumer updates of the outermost block
+    '''
+    def __init__(self):
+        self.stack = []
+
+
+_deferred_sync = _DeferredSyncState()
+
+
+def defer_update_consumer(member):
+    '''
+    Queue a consumer update for the member if a `deferred_neo_sync` block
+    is active. Returns False if the update should be sent immediately.
+    '''
+    if not _deferred_sync.stack:
+        return False
+    pending = _deferred_sync.stack[-1]
+    if member.pk in pending:
+        # merge with the earlier mutation, keeping the original snapshot
+        pending[member.pk][0] = member
+    else:
+        pending[member.pk] = [member, member_snapshot(member)]
+    return True
+
+
+def _dispatch_update(entry):
+    member, old_member = entry
+    try:
+        update_consumer(member, old_member=old_member)
+    except Exception, e:
+        return e
+    finally:
+        # worker threads get their own db connections
+        connection.close()
+    return None
+
+
+def dispatch_deferred_updates(pending):
+    '''
+    Send the merged consumer updates concurrently.
+    Returns a list of (member, exception) tuples for the updates that failed.
+    '''
+    entries = pending.values()
+    if not entries:
+        return []
+    pool = ThreadPool(min(SYNC_WORKERS, len(entries)))
+    try:
+        results = pool.map(_dispatch_update, entries)
+    finally:
+        pool.close()
+        pool.join()
+    failures = []
+    for (member, old_member), e in zip(entries, results):
+        if e is not None:
+            logger.error("Consumer of member %s could not be updated via Neo - %s", member.pk, e)
+            failures.append((member, e))
+    return failures
+
+
+class deferred_neo_sync(object):
+    '''
+    Context manager (or decorator) that runs a block in a transaction, like
+    `transaction.commit_on_success`, and defers consumer updates until the
+    transaction has been committed.
+
+    Updates to the same member are merged and sent once on commit, and all
+    members are dispatched concurrently. Nothing is sent on rollback.
+    Consumer creation is not deferred since the consumer id is needed to
+    save the NeoProfile.
+
+    Nested blocks join the transaction of the outermost block, and their
+    updates are sent when it commits. The updates that failed are logged,
+    and kept as (member, exception) tuples in the `failures` attribute of
+    the outermost block's context manager.
+    '''
+
+    def __init__(self, using=None):
+        self.using = using
+        self.failures = []
+
+    def __enter__(self):
+        self.outermost = not _deferred_sync.stack
+        if self.outermost:
+            self.transaction = transaction.commit_on_success(using=self.using)
+            self.transaction.__enter__()
+            _deferred_sync.stack.append(SortedDict())
+        else:
+            _deferred_sync.stack.append(_deferred_sync.stack[-1])
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pending = _deferred_sync.stack.pop()
+        if not self.outermost:
+            return False
+        try:
+            self.transaction.__exit__(exc_type, exc_value, traceback)
+        except:
+            _restore_snapshots(pending)
+            raise
+        if exc_type is not None:
+            _restore_snapshots(pending)
+        else:
+            self.failures = dispatch_deferred_updates(pending)
+        return False
+
+    def __call__(self, func):
+        @wraps(func)
+        def inner(*args, **kwargs):
+            with deferred_neo_sync(using=self.using):
+                return func(*args, **kwargs)
+        return inner
+
+
+def _restore_snapshots(pending):
+    '''
+    The member cache (and with MCAL the member's init values) is updated
+    on save - undo that for rolled back members
+    '''
+    for pk, (member, old_member) in pending.iteritems():
+        if old_member is None:
+            cache.delete('neo_consumer_%s' % pk)
+            member._neo_init_values = None
+        else:
+            cache.set('neo_consumer_%s' % pk, old_member, 1200)
+            if USE_MCAL:
+                init_values = dict(old_member)
+                init_values['country'] = getattr(old_member.get('country', None), 'pk', None)
+                member._neo_init_values = init_values
+
+
 # stash Member.full_clean original
 original_member_full_clean = Member.full_clean
 
@@ -260,7 +653,8 @@ def clean_member(member):
             has_neoprofile = False
 
         if member.pk and has_neoprofile:
-            update_consumer(member)
+            if not defer_update_consumer(member):
+                update_consumer(member)
         else:
             member.neoprofile = create_consumer(member)
             if member.pk:
@@ -269,6 +663,28 @@ def clean_member(member):
     member.need_to_clean_member = False
 
 
+def sync_neo_mirror(member_id, values, modified=None):
+    '''
+    Update the member's NeoMirror with the given member attribute values,
+    and the time of modification if the member was saved
+    '''
+    country = values.get('country', None)
+    attrs = dict((k, values.get(k, None)) for k in MIRROR_FIELDS if k != 'country_code')
+    attrs['country_code'] = country.country_code if country else None
+    if modified is not None:
+        attrs['modified'] = modified
+    if not NeoMirror.objects.filter(user=member_id).update(**attrs):
+        sid = transaction.savepoint()
+        try:
+            NeoMirror.objects.create(user_id=member_id, **attrs)
+        except IntegrityError:
+            # another process created the mirror after our update
+            transaction.savepoint_rollback(sid)
+            NeoMirror.objects.filter(user=member_id).update(**attrs)
+        else:
+            transaction.savepoint_commit(sid)
+
+
 # stash Member.save original
 original_member_save = Member.save
 
@@ -297,6 +713,12 @@ def save_member(member, *args, **kwargs):
         stashed_fields.update(dict((k, getattr(member, k)) for k in JMBO_REQUIRED_FIELDS))
         # cache the member fields after successfully creating/updating
         cache.set('neo_consumer_%s' % member.pk, stashed_fields, 1200)
+        sync_neo_mirror(member.pk, stashed_fields, modified=timezone.now())
+    else:
+        sync_neo_mirror(member.pk, dict((k, getattr(member, k)) for k in NEO_ATTR), modified=timezone.now())
+    if USE_MCAL:
+        # the saved values are what the next save gets diffed against
+        capture_init_values(member)
 
     # save the member's neo profile if it exists
     try:
@@ -315,26 +737,23 @@ def load_consumer(sender, *args, **kwargs):
         cache_key = 'neo_consumer_%s' % instance.id
         if USE_MCAL:
             '''
-            All member fields are in our database
+            All member fields are in our database. Only capture their raw
+            values here - the snapshot is built when the member is saved.
             '''
-            if not cache.has_key(cache_key):
-                member_dict = dict((k, getattr(instance, k)) for k in NEO_ATTR.union(ADDRESS_FIELDS))
-                cache.set(cache_key, member_dict, 1200)
+            capture_init_values(instance)
         else:
             '''
             Members with a corresponding consumer in CIDB
             won't have all fields stored in our database
             '''
             try:
+                record_cache_lookup()
                 member_dict = cache.get(cache_key, None)
                 if not member_dict:
                     neoprofile = instance.neoprofile
                     if neoprofile:
                          # retrieve consumer from Neo
-                        consumer = api.get_consumer(instance.neoprofile.consumer_id)
-                        wrapper = ConsumerWrapper(consumer=consumer)
-                        member_dict = dict((k, getattr(wrapper, k)) for k in NEO_ATTR)
-                        member_dict.update(wrapper.address)
+                        member_dict = consumer_member_dict(api.get_consumer_xml(instance.neoprofile.consumer_id))
                 # update instance with Neo attributes
                 if member_dict:
                     for key, val in member_dict.iteritems():
@@ -346,13 +765,14 @@ def load_consumer(sender, *args, **kwargs):
 signals.post_init.connect(load_consumer, sender=Member)
 
 
-def dataloadtool_export(output, credentials_output, members, password_callback=None, pretty_print=False):
+def dataloadtool_export(output, credentials_output, members, password_callback=None, pretty_print=False,
+                        chunk_size=EXPORT_CHUNK_SIZE, reject=None, profile=None):
     """
     Export the given members as XML input for the CIDB Data Load Tool.
 
     :param output: File-like object to write to.
-    :param members: Queryset of members to export. If this is a large queryset,
-        consider using `iterator()` on it, to avoid excessive caching.
+    :param members: Queryset of members to export. The members are fetched
+        `chunk_size` at a time, in username order.
 
     :param password_callback:
         If supplied, use this function to set or generate new passwords as part
@@ -364,26 +784,114 @@ def dataloadtool_export(output, credentials_output, members, password_callback=N
         password in the export. (To preserve what the default exported password
         would be, the function can explicitly return the member's
         `raw_password`, if it is set.)
+
+        A function decorated with `batch_password_callback` is instead passed
+        a list of up to `chunk_size` members at a time, and should return a
+        dict of member pks to passwords (or `None`). Members that are not in
+        the dict keep their default password. The next chunk's passwords are
+        looked up in a background thread while the current chunk is exported.
+
+    :param reject: If supplied, invalid records are passed to this function
+        instead of being written. See `dataloadtool_export_records()`.
+    :param profile: If supplied, a `neo.profiling.ExportProfile` to record the
+        time and memory spent in each stage of the export.
     """
-    # XXX: We take advantage of the existing ConsumerWrapper logic to construct
-    # a GeneratedsSuper instance, which we then convert to lxml for further
-    # manipulation. Once ConsumerWrapper (or its replacement) can give us a
-    # lxml tree directly, we can skip this step.
-    def etree_from_gds(gds):
-        sio = StringIO()
-        gds.export(sio, 0, pretty_print=False)
-        return etree.fromstring(sio.getvalue())
-    password_path = objectify.ObjectPath('Consumer.UserAccount.LoginCredentials.Password')
-
-    output.write('<Consumers>\n')
-    last_username = ''
+    with etree.xmlfile(output) as xf:
+        with xf.element('Consumers'):
+            xf.write('\n')
+            dataloadtool_export_records(xf, credentials_output, members,
+                                        password_callback=password_callback, pretty_print=pretty_print,
+                                        chunk_size=chunk_size, reject=reject, profile=profile)
+    output.write('\n')
+
+
+def batch_password_callback(func):
+    '''
+    Mark func as a batch password callback for `dataloadtool_export`, which
+    is passed a list of members and returns a dict of member pks to passwords
+    '''
+    func.batch = True
+    return func
+
+
+def _call_password_callback(args):
+    password_callback, members = args
+    try:
+        return password_callback(members)
+    finally:
+        # worker threads get their own db connections
+        connection.close()
+
+
+def _password_batches(members, password_callback, chunk_size):
+    '''
+    Yield (member, passwords) for each of the members, where passwords is
+    the result of the batch `password_callback` for the member's chunk. The
+    callback is called for the next chunk while the current one is exported.
+    '''
+    pool = ThreadPool(1)
+    try:
+        chunk = list(islice(members, chunk_size))
+        pending = pool.apply_async(_call_password_callback, ((password_callback, chunk),)) if chunk else None
+        while chunk:
+            next_chunk = list(islice(members, chunk_size))
+            passwords = pending.get() or {}
+            if next_chunk:
+                pending = pool.apply_async(_call_password_callback, ((password_callback, next_chunk),))
+            for member in chunk:
+                yield member, passwords
+            chunk = next_chunk
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _no_lap(stage):
+    pass
+
+
+def dataloadtool_export_records(xf, credentials_output, members, password_callback=None, pretty_print=False,
+                                start=0, last_username='', checkpoint=None, checkpoint_interval=10000,
+                                chunk_size=EXPORT_CHUNK_SIZE, reject=None, profile=None):
+    """
+    Write the Consumer records of `dataloadtool_export()` to an lxml
+    incremental writer (`etree.xmlfile`) with the enclosing element open,
+    so that an export can be split into parts.
+
+    :param start: The recordNumber of the first record.
+    :param last_username: The lowercase username preceding the members in the
+        whole export, to resolve duplicate usernames across parts.
+    :param checkpoint: If supplied, this function is called after every
+        `checkpoint_interval` records with the next recordNumber and the last
+        member written, so that an interrupted export can be resumed.
+    :param chunk_size: The number of members fetched per query.
+    :param reject: If supplied, each record is validated against the
+        Consumers schema before it is written, and invalid records are
+        skipped, calling this function with the member and the validation
+        error message instead. Their record numbers are not reused.
+    :param profile: If supplied, a `neo.profiling.ExportProfile` to record the
+        time and memory spent in each stage of the export.
+    :return: The number of records written.
+    """
+    count = 0
     import time
     import csv
     credentials_csv = csv.DictWriter(credentials_output, ['username', 'login_alias', 'password'])
-    # Important: The iterator() call prevents memory usage from growing out
-    # of control, when exporting many members. Don't remove it accidentally.
-    for (i, member) in enumerate(members.select_related('neoprofile').order_by('username').iterator()):
+    schema = None if reject is None else dataloadtool_schema('Consumers.xsd')
+    lap = _no_lap if profile is None else profile.lap
+    # Important: Fetching the members in chunks keeps memory usage flat when
+    # exporting many members, and the duplicate username resolution below
+    # depends on the username order. Don't replace it accidentally.
+    members = keyset_iterator(members.select_related('neoprofile'), ('username', 'pk'), chunk_size)
+    if getattr(password_callback, 'batch', False):
+        members = _password_batches(members, password_callback, chunk_size)
+    else:
+        members = ((member, None) for member in members)
+    for (i, (member, passwords)) in enumerate(members, start):
+        # with a batch password callback, this includes waiting for the passwords
+        lap('fetch')
         # Resolve duplicate usernames, or use available login_alias
+        credentials = None
         try:
             wrapper = wrap_member(member, login_alias=member.neoprofile.login_alias, password=member.neoprofile.password)
         except (NeoProfile.DoesNotExist, AttributeError):
@@ -396,31 +904,49 @@ def dataloadtool_export(output, credentials_output, members, password_callback=N
                 login_alias = member.username
             login_alias = normalize_username(login_alias)
             wrapper = wrap_member(member, login_alias=login_alias, password=password)
-            # write aliases and passwords to file
-            credentials_csv.writerow({
+            credentials = {
                 'username': member.username.encode('utf-8'),
                 'login_alias': login_alias.encode('utf-8'),
                 'password': password.encode('utf-8')
-            })
-        last_username = member.username.lower()
+            }
+        lap('wrap_member')
+
+        if passwords is not None:
+            if member.pk in passwords:
+                wrapper.set_password(passwords[member.pk])
+            lap('password_callback')
+        elif password_callback is not None:
+            # Set, replace or (with None) clear the password.
+            wrapper.set_password(password_callback(member))
+            lap('password_callback')
+
+        consumer = gds_to_etree(wrapper.consumer, 'Consumer', {'recordNumber': str(i)})
+        lap('conversion')
+        if schema is not None:
+            # the schema only has the Consumers element at the top level
+            etree.Element('Consumers').append(consumer)
+            valid = schema.validate(consumer.getparent())
+            lap('validation')
+            if not valid:
+                reject(member, schema.error_log.last_error.message)
+                lap('reject')
+                continue
 
-        elem = etree_from_gds(wrapper.consumer)
-        elem.attrib['recordNumber'] = str(i)
-
-        if password_callback is not None:
-            new_password = password_callback(member)
-            if new_password is not None:
-                # Set (or replace) the password.
-                password_path.setattr(elem, new_password)
-                objectify.deannotate(password_path(elem), cleanup_namespaces=True)
-            elif password_path.hasattr(elem):
-                # Clear the existing password element, if one exists.
-                old_password = password_path(elem)
-                old_password.getparent().remove(old_password)
-
-        output.write(etree.tostring(elem, pretty_print=pretty_print))
-        output.write('\n')
-    output.write('</Consumers>\n')
+        last_username = member.username.lower()
+        if credentials is not None:
+            # write aliases and passwords to file
+            credentials_csv.writerow(credentials)
+            lap('credentials')
+        xf.write(consumer, pretty_print=pretty_print)
+        xf.write('\n')
+        lap('serialization_and_write')
+        count += 1
+        if profile is not None:
+            profile.record()
+        if checkpoint is not None and count % checkpoint_interval == 0:
+            checkpoint(i + 1, member)
+            lap('checkpoint')
+    return count
 
 
 '''
@@ -0,0 +1,106 @@
+'''
+Per-stage profiling of Data Load Tool exports, to tell whether an export is
+bound by the database, the conversion to XML or the password callback
+'''
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    # Python 2 needs the pytracemalloc patches; only times are recorded without it
+    tracemalloc = None
+
+
+class ExportProfile(object):
+    '''
+    Records the time spent and the memory allocated in each stage of an
+    export, and the records per second over time.
+
+    `lap(stage)` is called at the end of each stage, so a stage's time is the
+    time since the previous lap, and `record()` after each record. Memory is
+    the net change in memory traced by `tracemalloc`, if it is available.
+    '''
+
+    def __init__(self, interval=10.0, trace_memory=True):
+        # stage name -> [seconds, net bytes allocated, laps]
+        self.stages = {}
+        self.order = []
+        self.interval = interval
+        # (seconds since the start, records per second) for each interval
+        self.throughput = []
+        self.records = 0
+        self.trace_memory = trace_memory and tracemalloc is not None
+        self.started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start()
+        self.start = self.last = self.interval_start = time.time()
+        self.interval_records = 0
+        self.memory = self.traced_memory()
+        self.elapsed = None
+
+    def traced_memory(self):
+        return tracemalloc.get_traced_memory()[0] if self.trace_memory else 0
+
+    def lap(self, stage):
+        now = time.time()
+        memory = self.traced_memory()
+        totals = self.stages.get(stage)
+        if totals is None:
+            totals = self.stages[stage] = [0.0, 0, 0]
+            self.order.append(stage)
+        totals[0] += now - self.last
+        totals[1] += memory - self.memory
+        totals[2] += 1
+        self.last = now
+        self.memory = memory
+
+    def record(self):
+        self.records += 1
+        self.interval_records += 1
+        if self.last - self.interval_start >= self.interval:
+            self.end_interval()
+
+    def end_interval(self):
+        if self.interval_records and self.last > self.interval_start:
+            self.throughput.append((round(self.last - self.start, 3),
+                                    self.interval_records / (self.last - self.interval_start)))
+        self.interval_start = self.last
+        self.interval_records = 0
+
+    def finish(self):
+        self.end_interval()
+        self.elapsed = time.time() - self.start
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    def as_dict(self):
+        elapsed = self.elapsed if self.elapsed is not None else time.time() - self.start
+        return {
+            'records': self.records,
+            'seconds': elapsed,
+            'records_per_second': self.records / elapsed if elapsed > 0 else 0.0,
+            'stages': [{
+                'stage': stage,
+                'seconds': self.stages[stage][0],
+                'allocated': self.stages[stage][1] if self.trace_memory else None,
+                'laps': self.stages[stage][2],
+            } for stage in self.order],
+            'throughput': self.throughput,
+        }
+
+    def summary(self):
+        '''
+        Return the per-stage totals as a text table
+        '''
+        profile = self.as_dict()
+        total = sum(stage['seconds'] for stage in profile['stages']) or 1.0
+        lines = ['%-20s %10s %7s %12s %12s' % ('Stage', 'Seconds', '%', 'us/record', 'Net KiB')]
+        for stage in profile['stages']:
+            lines.append('%-20s %10.3f %6.1f%% %12.1f %12s' % (
+                stage['stage'], stage['seconds'], stage['seconds'] * 100 / total,
+                stage['seconds'] * 1e6 / max(1, profile['records']),
+                '-' if stage['allocated'] is None else '%.1f' % (stage['allocated'] / 1024.0)))
+        lines.append('%d records in %.3fs (%.1f/s)' % (profile['records'], profile['seconds'],
+                                                     profile['records_per_second']))
+        return '\n'.join(lines) + '\n'
@@ -1,8 +1,15 @@
 # encoding: utf-8
+import os
+import gzip
+import json
 import time
+import pickle
+import itertools
+import threading
 from os import path
 from datetime import timedelta
 from io import BytesIO
+from StringIO import StringIO
 import logging
 import requests
 
@@ -14,24 +21,32 @@ from django.utils import timezone
 from django.core import management
 from django.core.cache import cache
 from django.conf import settings
-from django.http import HttpRequest
+from django.http import HttpRequest, HttpResponse
 from django.utils.importlib import import_module
 from django.contrib.auth import login, authenticate
 from django.db import connection, transaction, IntegrityError
 
 from foundry.models import Member, Country
 
-from neo.models import NeoProfile, NEO_ATTR, ADDRESS_FIELDS, dataloadtool_export
+from neo.models import NeoProfile, ExportWatermark, NEO_ATTR, ADDRESS_FIELDS, dataloadtool_export, \
+    deferred_neo_sync, bulk_create_consumers, diff_member, batch_password_callback, NeoMirror, sync_neo_mirror
 from neo import api, constants
-from neo.xml import AnswerType
+from neo.dispatch import NotificationDispatcher
+from neo.budget import neo_budget, NeoBudgetExceeded
+from neo.middleware import NeoBudgetMiddleware
+from neo.management.commands.members_to_cidb_dataloadtool import plan_shards, export_shard, \
+    copy_part
+from neo import xml as neo_xml
+from neo.xml import AnswerType, ResponseListType, parseString
 from neo.utils import BRAND_ID, PROMO_CODE, ConsumerWrapper, dataloadtool_schema, \
-    normalize_username
+    normalize_username, keyset_iterator, consumer_member_dict, gds_to_etree
 
 
 class _MemberTestCase(object):
     """
     Test helper for member creation.
     """
+    last_id = 0
 
     @classmethod
     def setUpClass(cls):
@@ -76,10 +91,7 @@ class _MemberTestCase(object):
     def create_member_partial(cls, commit=True):
         attrs = cls.member_attrs.copy()
         del attrs['gender']
-        # unique email and username for this test run
-        id = "%f" % time.time()
-        dot = id.rindex('.')
-        id = id[dot - 7:dot] + id[dot+1:dot+4]
+        id = cls.unique_id()
         attrs['username'] = 'user_%s' % id
         attrs['email'] = "%s@praekeltconsulting.com" % id
         attrs['mobile_number'] = id
@@ -89,6 +101,17 @@ class _MemberTestCase(object):
             member.save()
         return member
 
+    @classmethod
+    def unique_id(cls):
+        """
+        Return a unique id for the email, username and mobile number of a
+        test member, based on the current time in milliseconds so that it is
+        unique across test runs too.
+        """
+        id = max(int(time.time() * 1000) % 10 ** 10, _MemberTestCase.last_id + 1)
+        _MemberTestCase.last_id = id
+        return '%010d' % id
+
     @classmethod
     def create_member(cls):
         member = cls.create_member_partial(commit=False)
@@ -105,6 +128,11 @@ class _MemberTestCase(object):
         Member.save = stashed_save
         return member
 
+    @classmethod
+    def create_profile(cls, user, consumer_id, password='password'):
+        return NeoProfile.objects.create(user=user, consumer_id=consumer_id,
+                                         login_alias=normalize_username(user.username), password=password)
+
 
 class NeoTestCase(_MemberTestCase, TestCase):
 
@@ -310,6 +338,176 @@ class NeoTestCase(_MemberTestCase, TestCase):
         self.assertIn("update_consumer(consumer_id='1', consumer=",
                       mock_handle.call_args_list[4][0][0].getMessage())
 
+    @patch('requests.get')
+    def test_get_consumer_xml_malformed(self, mock_get):
+        mocked_response = requests.Response()
+        mocked_response.status_code = 200
+        mocked_response._content = '<Consumer><ConsumerProfile>'
+        mock_get.return_value = mocked_response
+        with self.assertRaises(Exception) as cm:
+            api.get_consumer_xml(1)
+        self.assertNotIsInstance(cm.exception, etree.XMLSyntaxError)
+        self.assertEqual(cm.exception.args, (mocked_response.content,))
+
+    @patch('neo.api.get_consumer_profile')
+    @patch('neo.api.update_consumer')
+    def test_deferred_sync(self, mock_update, mock_get_profile):
+        member = self.create_member()
+        with deferred_neo_sync():
+            member.first_name = 'deferred_first'
+            member.save()
+            member.last_name = 'deferred_last'
+            member.save()
+            self.assertEqual(mock_update.call_count, 0)
+        # both saves should be merged into a single update
+        self.assertEqual(mock_update.call_count, 1)
+        wrapper = ConsumerWrapper(consumer=mock_update.call_args[0][1])
+        self.assertEqual(wrapper.first_name, 'deferred_first')
+        self.assertEqual(wrapper.last_name, 'deferred_last')
+
+    @patch('neo.api.update_consumer')
+    def test_deferred_sync_rollback(self, mock_update):
+        member = self.create_member()
+        with self.assertRaises(IntegrityError):
+            with deferred_neo_sync():
+                member.first_name = 'rolled_back'
+                member.save()
+                raise IntegrityError()
+        self.assertEqual(mock_update.call_count, 0)
+        self.assertEqual(cache.get('neo_consumer_%s' % member.pk)['first_name'],
+                         self.member_attrs['first_name'])
+
+    @patch('neo.api.get_consumer_profile')
+    @patch('neo.api.update_consumer')
+    def test_deferred_sync_nested(self, mock_update, mock_get_profile):
+        member = self.create_member()
+        with self.assertRaises(IntegrityError):
+            with deferred_neo_sync():
+                with deferred_neo_sync():
+                    member.first_name = 'nested'
+                    member.save()
+                # the nested block joins the outer transaction
+                self.assertEqual(mock_update.call_count, 0)
+                raise IntegrityError()
+        self.assertEqual(mock_update.call_count, 0)
+        self.assertEqual(cache.get('neo_consumer_%s' % member.pk)['first_name'],
+                         self.member_attrs['first_name'])
+
+        mock_update.side_effect = Exception("Neo is down")
+        with deferred_neo_sync() as sync:
+            with deferred_neo_sync():
+                member.first_name = 'nested'
+                member.save()
+        self.assertEqual(mock_update.call_count, 1)
+        self.assertEqual([m.pk for m, e in sync.failures], [member.pk])
+
+    @patch('neo.api.get_consumer_profile')
+    @patch('neo.api.update_consumer')
+    def test_mcal_snapshot(self, mock_update, mock_get_profile):
+        if not settings.NEO.get('USE_MCAL', False):
+            return
+        member = self.create_member()
+        cache.clear()
+        # loading members shouldn't touch the cache
+        member = Member.objects.filter(pk=member.pk)[0]
+        self.assertIsNone(cache.get('neo_consumer_%s' % member.pk))
+        member.first_name = 'snapshot_first'
+        member.save()
+        wrapper = ConsumerWrapper(consumer=mock_update.call_args[0][1])
+        self.assertEqual(wrapper.first_name, 'snapshot_first')
+        self.assertIsNone(wrapper.last_name)
+        # the next save is diffed against the saved values
+        member.last_name = 'snapshot_last'
+        member.save()
+        wrapper = ConsumerWrapper(consumer=mock_update.call_args[0][1])
+        self.assertIsNone(wrapper.first_name)
+        self.assertEqual(wrapper.last_name, 'snapshot_last')
+
+    @patch('neo.api.get_consumer_profile')
+    @patch('neo.api.update_consumer')
+    def test_mcal_snapshot_deferred(self, mock_update, mock_get_profile):
+        if not settings.NEO.get('USE_MCAL', False):
+            return
+        member = self.create_member()
+        cache.clear()
+        # the snapshot is read from the db for members loaded with deferred fields
+        member = Member.objects.only('id', 'username', 'first_name').get(pk=member.pk)
+        member.first_name = 'deferred_first'
+        member.save()
+        self.assertEqual(mock_update.call_count, 1)
+        wrapper = ConsumerWrapper(consumer=mock_update.call_args[0][1])
+        self.assertEqual(wrapper.first_name, 'deferred_first')
+        self.assertIsNone(wrapper.last_name)
+
+    @patch('neo.api.complete_registration')
+    @patch('neo.api.create_consumer')
+    def test_bulk_create_consumers(self, mock_create, mock_complete):
+        members = []
+        for i in range(3):
+            members.append(self.create_member_without_neo())
+        consumer_ids = dict((normalize_username(m.username), str(900000 + i))
+                            for i, m in enumerate(members))
+
+        def mock_create_consumer(consumer):
+            username = consumer.UserAccount.LoginCredentials.LoginName
+            if username == normalize_username(members[1].username):
+                raise Exception("Consumer could not be created")
+            return consumer_ids[username], None
+
+        mock_create.side_effect = mock_create_consumer
+        created, failures = bulk_create_consumers(members, workers=2, chunk_size=2)
+        self.assertEqual(set(p.user for p in created), set([members[0], members[2]]))
+        self.assertEqual([m for m, e in failures], [members[1]])
+        self.assertEqual(NeoProfile.objects.filter(user__in=members).count(), 2)
+        self.assertEqual(mock_complete.call_count, 2)
+
+    def test_neo_filter(self):
+        member = self.create_member()
+        self.assertEqual(list(Member.objects.neo_filter(email=member.email)), [member])
+        self.assertEqual(Member.objects.neo_filter(mobile_number=member.mobile_number,
+                                                   country_code='US', gender='F').count(), 1)
+        self.assertEqual(Member.objects.neo_exclude(email=member.email)
+                         .filter(pk=member.pk).count(), 0)
+        member.first_name = 'mirrored'
+        member.save()
+        self.assertEqual(Member.objects.neo_filter(first_name__iexact='MIRRORED')
+                         .neo_order_by('-dob', 'last_name')[0], member)
+
+    def test_backfill_mirror(self):
+        member = self.create_member()
+        NeoMirror.objects.filter(user=member).delete()
+        self.assertEqual(Member.objects.neo_filter(email=member.email).count(), 0)
+        management.call_command('neo_backfill_mirror', stdout=StringIO())
+        self.assertEqual(list(Member.objects.neo_filter(email=member.email)), [member])
+        # an existing mirror is updated in place
+        sync_neo_mirror(member.pk, {'email': 'other@example.com'})
+        self.assertEqual(NeoMirror.objects.get(user=member).email, 'other@example.com')
+
+    def test_diff_member(self):
+        member = self.immutable_member
+        old_member = dict((k, getattr(member, k)) for k in NEO_ATTR.union(ADDRESS_FIELDS))
+        self.assertTrue(diff_member(member, old_member).is_empty)
+        # remove the member's address
+        attrs = self.member_attrs.copy()
+        for key in ('address', 'city', 'province', 'zipcode', 'country'):
+            attrs[key] = None
+        wrapper = diff_member(Member(**attrs), old_member)
+        address = wrapper.consumer.ConsumerProfile.Address[0]
+        self.assertEqual(address.ModifyFlag, constants.modify_flag['DELETE'])
+        self.assertEqual(address.Address1, member.address)
+
+    def test_consumer_member_dict(self):
+        from neo.models import wrap_member
+        member = self.immutable_member
+        sio = BytesIO()
+        wrap_member(member).consumer.export(sio, 0)
+        wrapper = ConsumerWrapper(consumer=parseString(sio.getvalue()))
+        member_dict = dict((k, getattr(wrapper, k)) for k in NEO_ATTR)
+        member_dict.update(wrapper.address)
+        self.assertEqual(consumer_member_dict(sio.getvalue()), member_dict)
+        self.assertEqual(member_dict['country'], member.country)
+        self.assertEqual(consumer_member_dict('<Consumer/>'), dict.fromkeys(NEO_ATTR))
+
     def test_username_normalization(self):
         # username should be lower case, [ +] replaced with '', and padded up to len = 4
         self.assertEqual(normalize_username('+T '), 't000')
@@ -477,6 +675,48 @@ class DataLoadToolExportTestCase(_MemberTestCase, TestCase):
             objectify.dump(expected),
             objectify.dump(consumers))
 
+    def test_batch_password_callback(self):
+        """
+        `dataloadtool_export()` should pass chunks of members to a batch password callback.
+        """
+        m1 = self.create_member()
+        m2 = self.create_member()
+
+        expected = self.expected_consumers([m1, m2])
+        expected.Consumer[0].UserAccount.LoginCredentials.Password = 'fnord'
+        objectify.deannotate(expected, cleanup_namespaces=True)
+
+        chunks = []
+
+        @batch_password_callback
+        def mock_passwords(members):
+            chunks.append([m.pk for m in members])
+            # m2 isn't in the result, so it keeps its password
+            return {m1.pk: 'fnord'}
+
+        consumers = self._dataloadtool_export(Member.objects.filter(pk__in=(m1.pk, m2.pk)),
+                                              password_callback=mock_passwords, chunk_size=1)
+        self.assertEqual(chunks, [[m1.pk], [m2.pk]])
+        self.assertEqual(
+            objectify.dump(expected),
+            objectify.dump(consumers))
+
+    def test_chunk_size(self):
+        """
+        Members fetched in several chunks are exported once each, in username order.
+        """
+        members = []
+        for i in range(3):
+            members.append(self.create_member())
+        queryset = Member.objects.filter(pk__in=[m.pk for m in members])
+        self.assertEqual([m.pk for m in keyset_iterator(queryset, ('username', 'pk'), 2)],
+                         [m.pk for m in members])
+
+        consumers = self._dataloadtool_export(queryset, chunk_size=2)
+        self.assertEqual(
+            objectify.dump(self.expected_consumers(members)),
+            objectify.dump(consumers))
+
 
 class DataLoadToolExportCommandTestCase(_MemberTestCase, TestCase):
     """
@@ -573,6 +813,111 @@ class DataLoadToolExportCommandTestCase(_MemberTestCase, TestCase):
             set(c.ConsumerProfile.FirstName for c in consumers.Consumer),
             set(['foo', 'bar', 'NEO member']))
 
+    def test_watermark(self):
+        """
+        With "--watermark", only members that joined since the last export are exported.
+        """
+        self.create_member_named('foo', with_neoprofile=False)
+        consumers = self._call_command_validated(watermark='test')
+        self.assertEqual(set(c.ConsumerProfile.FirstName for c in consumers.Consumer), set(['foo']))
+        watermark = ExportWatermark.objects.get(name='test').watermark
+
+        self.create_member_named('bar', with_neoprofile=False)
+        consumers = self._call_command_validated(watermark='test')
+        self.assertEqual(set(c.ConsumerProfile.FirstName for c in consumers.Consumer), set(['bar']))
+        self.assertGreater(ExportWatermark.objects.get(name='test').watermark, watermark)
+
+        consumers = self._call_command_validated(since=watermark.isoformat())
+        self.assertEqual(set(c.ConsumerProfile.FirstName for c in consumers.Consumer), set(['bar']))
+
+    def test_shards(self):
+        """
+        Shards exported separately merge into consistently numbered records.
+        """
+        for name in ('foo', 'bar', 'baz'):
+            self.create_member_named(name, with_neoprofile=False)
+        members = self.command.get_members()
+        usernames = list(members.order_by('username').values_list('username', flat=True))
+        shards = plan_shards(members, 2)
+        self.assertEqual(shards, [(0, usernames[0], ''), (2, usernames[2], usernames[1])])
+
+        output = BytesIO()
+        output.write('<Consumers>\n')
+        for n, (start, first, previous) in enumerate(shards):
+            upper = shards[n + 1][1] if n + 1 < len(shards) else None
+            xml_path, csv_path, rejects_path = export_shard((members.query, start, first, upper, previous,
+                                               self.test_output_path, self.test_output_credentials_path, None, None,
+                                               False, 2))
+            copy_part(xml_path, output)
+        output.write('</Consumers>\n')
+        consumers = objectify.fromstring(output.getvalue(), self.consumers_parser)
+        self.assertEqual([c.attrib['recordNumber'] for c in consumers.Consumer], ['0', '1', '2'])
+        self.assertEqual([c.UserAccount.LoginCredentials.LoginName for c in consumers.Consumer],
+                         [normalize_username(u) for u in usernames])
+
+    def test_validate(self):
+        """
+        With "--validate", invalid records are written to the rejects file instead of the output.
+        """
+        self.create_member_named('foo', with_neoprofile=False)
+        self.create_member_named('x' * 51, with_neoprofile=False)  # FirstName is limited to 50 characters
+        invalid = Member.objects.get(first_name='x' * 51)
+        rejects_path = '%s.rejects' % self.test_output_credentials_path
+
+        consumers = self._call_command_validated(validate=True)
+        self.assertEqual([c.ConsumerProfile.FirstName for c in consumers.Consumer], ['foo'])
+        self.assertEqual(len(open(self.test_output_credentials_path).read().splitlines()), 1)
+        rejects = open(rejects_path).read().splitlines()
+        self.assertEqual(len(rejects), 1)
+        self.assertTrue(rejects[0].startswith('%s,' % invalid.pk))
+        self.assertIn('FirstName', rejects[0])
+
+    def test_profile(self):
+        """
+        With "--profile", the time spent in each stage of the export is written as JSON.
+        """
+        self.create_member_named('foo', with_neoprofile=False)
+        self.create_member_named('bar', with_neoprofile=False)
+        profile_path = '%s.profile' % self.test_output_path
+        stderr = BytesIO()
+
+        consumers = self._call_command_validated(profile=profile_path, stderr=stderr)
+        self.assertEqual(set(c.ConsumerProfile.FirstName for c in consumers.Consumer), set(['foo', 'bar']))
+        profile = json.load(open(profile_path))
+        self.assertEqual(profile['records'], 2)
+        stages = dict((stage['stage'], stage) for stage in profile['stages'])
+        for stage in ('fetch', 'wrap_member', 'conversion', 'credentials', 'serialization_and_write'):
+            self.assertEqual(stages[stage]['laps'], 2)
+        self.assertIn('serialization_and_write', stderr.getvalue())
+
+    @staticmethod
+    def failing_password_callback(member):
+        if member.first_name == 'baz':
+            raise ValueError('interrupted')
+
+    def test_resume(self):
+        """
+        An interrupted export to compressed files continues from its last checkpoint with "--resume".
+        """
+        for name in ('foo', 'bar', 'baz'):
+            self.create_member_named(name, with_neoprofile=False)
+        filepath = '%s.gz' % self.test_output_path
+        credentials_filepath = '%s.gz' % self.test_output_credentials_path
+        kwargs = {'credentials_filepath': credentials_filepath, 'filepath': filepath, 'checkpoint_interval': 1}
+
+        callback = 'neo.tests:DataLoadToolExportCommandTestCase.failing_password_callback'
+        with self.assertRaises(ValueError):
+            management.call_command('members_to_cidb_dataloadtool', password_callback=callback, **kwargs)
+        checkpoint_path = '%s.checkpoint' % credentials_filepath
+        self.assertEqual(json.load(open(checkpoint_path))['record_number'], 2)
+
+        management.call_command('members_to_cidb_dataloadtool', resume=True, **kwargs)
+        self.assertFalse(path.exists(checkpoint_path))
+        consumers = objectify.fromstring(gzip.open(filepath).read(), self.consumers_parser)
+        self.assertEqual([c.attrib['recordNumber'] for c in consumers.Consumer], ['0', '1', '2'])
+        self.assertEqual([c.ConsumerProfile.FirstName for c in consumers.Consumer], ['foo', 'bar', 'baz'])
+        self.assertEqual(len(gzip.open(credentials_filepath).read().splitlines()), 3)
+
     @staticmethod
     def mock_password_callback(member):
         return 'fnord'
@@ -600,3 +945,436 @@ class DataLoadToolExportCommandTestCase(_MemberTestCase, TestCase):
         for (name, message) in examples:
             with self.assertRaisesRegexp(management.CommandError, message):
                 self.command.load_callback(name)
+
+
+class RotatePasswordsCommandTestCase(_MemberTestCase, TestCase):
+    """
+    Tests the `neo_rotate_passwords` management command.
+    """
+
+    def setUp(self):
+        super(RotatePasswordsCommandTestCase, self).setUp()
+        self.checkpoint_path = path.join(path.dirname(__file__), 'test_rotate.checkpoint')
+        if path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        self.profiles = []
+        for i in range(3):
+            self.profiles.append(self.create_profile(self.create_member_without_neo(), 800000 + i,
+                                                     password='old_password'))
+
+    def tearDown(self):
+        if path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def _call_command(self, **kwargs):
+        management.call_command('neo_rotate_passwords', checkpoint=self.checkpoint_path,
+                                stdout=BytesIO(), stderr=BytesIO(), **kwargs)
+
+    @patch('neo.api.change_password')
+    @patch('neo.api.get_forgot_password_token')
+    def test_rotate_passwords(self, mock_token, mock_change):
+        self._call_command(workers=2, batch_size=2)
+        rotated = set(c[0][0] for c in mock_change.call_args_list)
+        for profile in self.profiles:
+            self.assertIn(profile.login_alias, rotated)
+            self.assertNotEqual(NeoProfile.objects.get(pk=profile.pk).password, 'old_password')
+        with open(self.checkpoint_path) as f:
+            self.assertEqual(json.load(f), {'last_pk': NeoProfile.objects.order_by('-pk')[0].pk,
+                                            'failed': []})
+
+    @patch('neo.api.change_password')
+    @patch('neo.api.get_forgot_password_token')
+    def test_resume(self, mock_token, mock_change):
+        with open(self.checkpoint_path, 'w') as f:
+            json.dump({'last_pk': self.profiles[1].pk, 'failed': [self.profiles[0].pk]}, f)
+        self._call_command()
+        # the failed profile is retried, and the run continues after the last checkpoint
+        rotated = set(c[0][0] for c in mock_change.call_args_list)
+        self.assertIn(self.profiles[0].login_alias, rotated)
+        self.assertIn(self.profiles[2].login_alias, rotated)
+        self.assertNotIn(self.profiles[1].login_alias, rotated)
+        self.assertEqual(NeoProfile.objects.get(pk=self.profiles[1].pk).password, 'old_password')
+
+
+class ImportDataLoadToolResultsCommandTestCase(_MemberTestCase, TestCase):
+    """
+    Tests the `neo_import_dataloadtool_results` management command.
+    """
+
+    def setUp(self):
+        super(ImportDataLoadToolResultsCommandTestCase, self).setUp()
+        self.results_path = path.join(path.dirname(__file__), 'test_results.csv')
+        self.credentials_path = path.join(path.dirname(__file__), 'test_alias.out')
+        self.members = []
+        for i in range(3):
+            self.members.append(self.create_member_without_neo())
+        self.other = self.create_member_without_neo()
+        NeoProfile.objects.create(user=self.other, consumer_id=900002, login_alias='other', password='password')
+
+    def _call_command(self, results, credentials):
+        with open(self.results_path, 'w') as f:
+            f.write('LoginName,ConsumerID\n')
+            f.writelines('%s,%s\n' % row for row in results)
+        with open(self.credentials_path, 'w') as f:
+            f.writelines('%s,%s,%s\n' % row for row in credentials)
+        stderr = BytesIO()
+        management.call_command('neo_import_dataloadtool_results', self.results_path, self.credentials_path,
+                                batch_size=2, stderr=stderr)
+        return stderr.getvalue()
+
+    def test_import(self):
+        m0, m1, m2 = self.members
+        credentials = [(m0.username, 'alias0', 'password0'), (m1.username, 'alias1', 'password1'),
+                       (m2.username, 'alias2', 'password2'), ('nobody', 'nobody', 'password')]
+        # alias1 wasn't loaded, and alias2 has the consumer id of another member
+        results = [('alias0', 900000), ('alias1', ''), ('alias2', 900002), ('nobody', 900003)]
+        stderr = self._call_command(results, credentials)
+        self.assertIn('1 created, 0 updated, 0 unchanged, 1 conflict, 1 missing_member, 1 not_loaded', stderr)
+
+        profile = NeoProfile.objects.get(user=m0)
+        self.assertEqual((profile.consumer_id, profile.login_alias, profile.password),
+                         (900000, 'alias0', 'password0'))
+        self.assertFalse(NeoProfile.objects.filter(user__in=(m1, m2)).exists())
+        self.assertEqual(NeoProfile.objects.get(consumer_id=900002).user_id, self.other.pk)
+
+        # importing again updates the changed profiles
+        stderr = self._call_command([('alias0', 900000), ('alias1', 900001)],
+                                    [(m0.username, 'alias0', 'new_password'), (m1.username, 'alias1', 'password1')])
+        self.assertIn('1 created, 1 updated', stderr)
+        self.assertEqual(NeoProfile.objects.get(user=m0).password, 'new_password')
+        self.assertEqual(NeoProfile.objects.get(user=m1).consumer_id, 900001)
+
+        # a profile with another consumer id isn't re-keyed
+        stderr = self._call_command([('alias0', 900004)], [(m0.username, 'alias0', 'password0')])
+        self.assertIn('0 updated, 0 unchanged, 1 conflict', stderr)
+        self.assertIn('user %d has consumer id 900000' % m0.pk, stderr)
+        self.assertEqual(NeoProfile.objects.get(user=m0).consumer_id, 900000)
+
+
+class ReconcileCommandTestCase(_MemberTestCase, TestCase):
+    """
+    Tests the `neo_reconcile` management command.
+    """
+
+    @patch('neo.api.get_consumer')
+    def test_reconcile_shard(self, mock_get_consumer):
+        from django.contrib.auth.models import User
+        from neo.models import wrap_member
+        from neo.management.commands.neo_reconcile import reconcile_shard
+
+        member = self.create_member_without_neo()
+        self.create_profile(member, 700000)
+        missing = self.create_member_without_neo()
+        self.create_profile(missing, 700001)
+        user = User.objects.create(username='orphan_%s' % member.username)
+        self.create_profile(user, 700002)
+
+        def mock_consumer(consumer_id, **kwargs):
+            if consumer_id == 700001:
+                raise Exception("Consumer not found")
+            drifted = wrap_member(member)
+            drifted.set_first_name('drifted')
+            return drifted.consumer
+
+        mock_get_consumer.side_effect = mock_consumer
+        records = dict((r['consumer_id'], r) for r in reconcile_shard((700000, 700003, 2, False)))
+        self.assertEqual(records[700001]['type'], 'missing')
+        self.assertEqual(records[700002], {'type': 'orphan', 'consumer_id': 700002, 'user_id': user.pk})
+        if settings.NEO.get('USE_MCAL', False):
+            self.assertEqual(records[700000]['type'], 'mismatch')
+            self.assertEqual(records[700000]['fields'],
+                             {'first_name': {'local': member.first_name, 'neo': 'drifted'}})
+
+    def test_plan_shards(self):
+        from neo.management.commands.neo_reconcile import plan_shards
+
+        self.assertEqual(plan_shards(2), [])
+        for consumer_id in (10, 20, 5000000, 9000000, 9000001):
+            self.create_profile(self.create_member_without_neo(), consumer_id)
+        self.assertEqual(plan_shards(2), [(10, 5000000), (5000000, 9000001), (9000001, None)])
+        self.assertEqual(plan_shards(5), [(10, None)])
+
+    @patch('neo.api.get_consumer')
+    def test_command(self, mock_get_consumer):
+        from django.contrib.auth.models import User
+
+        class InProcessPool(object):
+            # the test database isn't shared with worker processes
+            def __init__(self, processes):
+                pass
+
+            def imap(self, func, iterable):
+                return itertools.imap(func, iterable)
+
+            def close(self):
+                pass
+
+            def join(self):
+                pass
+
+        missing = self.create_member_without_neo()
+        self.create_profile(missing, 700010)
+        user = User.objects.create(username='orphan_%s' % missing.username)
+        self.create_profile(user, 700011)
+        mock_get_consumer.side_effect = Exception("Consumer not found")
+
+        stdout = StringIO()
+        stderr = StringIO()
+        with patch('neo.management.commands.neo_reconcile.Pool', InProcessPool):
+            management.call_command('neo_reconcile', processes=1, workers=1, stdout=stdout, stderr=stderr)
+        records = dict((r['consumer_id'], r) for r in map(json.loads, stdout.getvalue().splitlines()))
+        self.assertEqual(records[700010]['type'], 'missing')
+        self.assertEqual(records[700011]['type'], 'orphan')
+        self.assertFalse(stdout.closed)
+        self.assertIn('1 orphan, 1 missing', stderr.getvalue())
+
+
+class NotificationDispatcherTestCase(TestCase):
+    """
+    Tests `NotificationDispatcher`, used for background login and logout notifications.
+    """
+
+    def test_dispatch(self):
+        dispatcher = NotificationDispatcher()
+        calls = []
+        self.assertTrue(dispatcher.dispatch(calls.append, 1))
+        self.assertTrue(dispatcher.dispatch(calls.append, 2))
+        dispatcher.flush()
+        self.assertEqual(sorted(calls), [1, 2])
+        self.assertEqual(dispatcher.stats, {'queued': 2, 'sent': 2, 'failed': 0, 'dropped': 0})
+
+    def test_failure(self):
+        dispatcher = NotificationDispatcher()
+
+        def fail():
+            raise Exception("Neo Web Services not responding")
+
+        dispatcher.dispatch(fail)
+        dispatcher.flush()
+        self.assertEqual(dispatcher.stats['failed'], 1)
+
+    def test_flush_timeout(self):
+        dispatcher = NotificationDispatcher()
+        release = threading.Event()
+        dispatcher.dispatch(release.wait)
+        self.assertFalse(dispatcher.flush(timeout=0.01))
+        release.set()
+        self.assertTrue(dispatcher.flush(timeout=5))
+
+    def test_overflow(self):
+        dispatcher = NotificationDispatcher(max_queue_size=1, batch_size=1, workers=1, put_timeout=0)
+        started = threading.Event()
+        release = threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        dispatcher.dispatch(block)
+        started.wait()
+        # the background thread is busy, so the queue only has space for one call
+        self.assertTrue(dispatcher.dispatch(block))
+        self.assertFalse(dispatcher.dispatch(block))
+        release.set()
+        dispatcher.flush()
+        self.assertEqual(dispatcher.stats, {'queued': 2, 'sent': 2, 'failed': 0, 'dropped': 1})
+
+
+class NeoBudgetTestCase(TestCase):
+    """
+    Tests `neo_budget` and `NeoBudgetMiddleware`, which count the Neo calls made per request.
+    """
+
+    def setUp(self):
+        self.response = requests.Response()
+        self.response.status_code = 200
+
+    @patch('requests.put')
+    def test_neo_budget(self, mock_put):
+        mock_put.return_value = self.response
+        with neo_budget(max_calls=2) as outer:
+            api.logout(1)
+            with neo_budget(max_calls=2) as inner:
+                api.logout(1)
+        self.assertEqual(outer.calls, 2)
+        self.assertEqual(inner.calls, 1)
+        with self.assertRaises(NeoBudgetExceeded):
+            with neo_budget(max_calls=1, raise_over_budget=True):
+                api.logout(1)
+                api.logout(1)
+
+    @patch('requests.put')
+    def test_middleware(self, mock_put):
+        mock_put.return_value = self.response
+        middleware = NeoBudgetMiddleware()
+        request = HttpRequest()
+        request.path = '/members/'
+        middleware.process_request(request)
+        budget = request.neo_budget
+        api.logout(1)
+        with self.settings(DEBUG=True):
+            response = middleware.process_response(request, HttpResponse())
+        self.assertEqual(response['X-Neo-Calls'], '1')
+        self.assertEqual(response['X-Neo-Cache-Lookups'], '0')
+        # calls after the response aren't counted
+        api.logout(1)
+        self.assertEqual(budget.calls, 1)
+
+    @patch('requests.put')
+    def test_middleware_without_response(self, mock_put):
+        mock_put.return_value = self.response
+        middleware = NeoBudgetMiddleware()
+        request = HttpRequest()
+        request.path = '/members/'
+        middleware.process_request(request)
+        budget = request.neo_budget
+        # the view raised
+        self.assertIsNone(middleware.process_exception(request, Exception()))
+        api.logout(1)
+        self.assertEqual(budget.calls, 0)
+        # a later middleware raised, so the response never came back
+        middleware.process_request(request)
+        budget = request.neo_budget
+        next_request = HttpRequest()
+        next_request.path = '/members/'
+        middleware.process_request(next_request)
+        api.logout(1)
+        self.assertEqual((budget.calls, next_request.neo_budget.calls), (0, 1))
+        middleware.process_response(next_request, HttpResponse())
+
+
+class XMLParsingTestCase(TestCase):
+    """
+    Parsing Neo responses with `neo.xml`.
+    """
+
+    def test_parse_string(self):
+        responses = parseString('<Responses><!-- comment --><Response><ResponseCode>OK</ResponseCode>'
+                                '<ResponseMessage>Success</ResponseMessage></Response></Responses>')
+        self.assertIsInstance(responses, ResponseListType)
+        self.assertEqual([(r.ResponseCode, r.ResponseMessage) for r in responses.Response], [('OK', 'Success')])
+        # the parser is reused by the thread
+        parser = neo_xml._parsers_.parser
+        parseString('<Country><CountryCode>ZA</CountryCode></Country>')
+        self.assertIs(neo_xml._parsers_.parser, parser)
+
+    def test_build_tables(self):
+        """
+        The build tables build the same objects as the buildChildren methods, which subclasses still use.
+        """
+        class CountrySubclass(neo_xml.CountryType):
+            pass
+
+        data = ('<Country><CountryCode>ZA</CountryCode><OtherLanguageCode>af</OtherLanguageCode>'
+                '<OtherLanguageCode>zu</OtherLanguageCode><DefaultTimeZone><TimeZone>SAST</TimeZone>'
+                '<Offset>+02:00</Offset></DefaultTimeZone><Unknown/></Country>')
+        country = parseString(data)
+        self.assertIn(neo_xml.CountryType, neo_xml.build_tables_)
+        self.assertEqual(country.OtherLanguageCode, ['af', 'zu'])
+        self.assertEqual((country.DefaultTimeZone.TimeZone, country.DefaultTimeZone.Offset), ('SAST', '+02:00'))
+
+        subclass_country = CountrySubclass()
+        subclass_country.build(neo_xml.parsexml_string_(data))
+        self.assertEqual(subclass_country.OtherLanguageCode, country.OtherLanguageCode)
+        self.assertEqual(neo_xml.as_dict_(subclass_country.DefaultTimeZone),
+                         neo_xml.as_dict_(country.DefaultTimeZone))
+
+    def test_slots(self):
+        """
+        The parsed objects keep their children in slots, without a __dict__.
+        """
+        timezone = parseString('<Country><DefaultTimeZone><TimeZone>SAST</TimeZone><Offset>+02:00</Offset>'
+                               '</DefaultTimeZone></Country>').DefaultTimeZone
+        self.assertFalse(hasattr(timezone, '__dict__'))
+        self.assertEqual(neo_xml.as_dict_(timezone), {'TimeZone': 'SAST', 'Offset': '+02:00'})
+        self.assertRaises(AttributeError, setattr, timezone, 'Unknown', 'value')
+        self.assertEqual(neo_xml.as_dict_(pickle.loads(pickle.dumps(timezone, 2))), neo_xml.as_dict_(timezone))
+
+    def test_lazy(self):
+        """
+        Lazily parsed objects build their children when they are first read.
+        """
+        data = ('<Consumer><ConsumerProfile><FirstName>first</FirstName><Gender>1</Gender>'
+                '<Email><EmailId>a@example.com</EmailId><EmailCategory>1</EmailCategory></Email>'
+                '<Email><EmailId>b@example.com</EmailId><EmailCategory>2</EmailCategory></Email>'
+                '</ConsumerProfile><SocialNetworks><Unknown/></SocialNetworks></Consumer>')
+        consumer = parseString(data, lazy=True)
+        self.assertIsInstance(consumer, neo_xml.Consumer)
+        profile = consumer.ConsumerProfile
+        self.assertIs(consumer.ConsumerProfile, profile)
+        self.assertEqual([e.EmailId for e in profile.Email], ['a@example.com', 'b@example.com'])
+        self.assertEqual((profile.FirstName, profile.Gender, profile.LastName, profile.Phone),
+                         ('first', 1, None, []))
+        self.assertEqual(sorted(neo_xml.as_dict_(profile)), sorted(neo_xml.as_dict_(neo_xml.ConsumerProfileType())))
+        consumer.UserAccount = neo_xml.UserAccountType()
+        self.assertEqual(consumer.UserAccount.LoginCredentials, None)
+
+        wrapper = ConsumerWrapper(consumer=parseString(data, lazy=True))
+        eager_wrapper = ConsumerWrapper(consumer=parseString(data))
+        for field in ('first_name', 'last_name', 'dob', 'gender', 'email', 'mobile_number', 'username'):
+            self.assertEqual(getattr(wrapper, field), getattr(eager_wrapper, field))
+
+        invalid = parseString(data.replace('<Gender>1', '<Gender>x'), lazy=True)
+        self.assertRaises(neo_xml.GDSParseError, getattr, invalid.ConsumerProfile, 'Gender')
+
+        # lazy objects are pickled as fully built objects
+        consumer = pickle.loads(pickle.dumps(parseString(data, lazy=True), 2))
+        self.assertIs(type(consumer), neo_xml.Consumer)
+        self.assertIs(type(consumer.ConsumerProfile), neo_xml.ConsumerProfileType)
+        self.assertEqual(neo_xml.export_compact_(consumer), neo_xml.export_compact_(parseString(data)))
+
+    def test_export_compact(self):
+        """
+        export_compact_ writes the same XML as export without pretty printing.
+        """
+        class AnswerSubclass(AnswerType):
+            pass
+
+        data = ('<Consumer><ConsumerProfile><FirstName>a &amp; b</FirstName><Gender>1</Gender>'
+                '<Address/></ConsumerProfile><Preferences><QuestionCategory><CategoryID>2</CategoryID>'
+                '<QuestionAnswers><QuestionID>64</QuestionID><Answer><OptionID>1</OptionID></Answer>'
+                '</QuestionAnswers></QuestionCategory></Preferences></Consumer>')
+        consumer = parseString(data)
+        consumer.Preferences.QuestionCategory[0].QuestionAnswers[0].add_Answer(AnswerSubclass(OptionID=99))
+        sio = BytesIO()
+        consumer.export(sio, 0, pretty_print=False)
+        self.assertEqual(neo_xml.export_compact_(consumer), sio.getvalue())
+        self.assertEqual(neo_xml.export_compact_(parseString(data, lazy=True)), data)
+        self.assertEqual(neo_xml.export_compact_(consumer.Preferences, 'Preferences')[:13], '<Preferences>')
+        self.assertEqual(neo_xml.export_compact_(neo_xml.LoginDetails(LastLoginSuccess=True)),
+                         '<LoginDetails><LastLoginSuccess>true</LastLoginSuccess></LoginDetails>')
+
+    def test_gds_to_etree(self):
+        """
+        gds_to_etree builds the same elements as parsing the output of export.
+        """
+        values = {'string': u'a & <b>', 'integer': 7, 'boolean': True}
+
+        def populate(class_name, depth=0):
+            obj = getattr(neo_xml, class_name)()
+            for tag, type_name, many in neo_xml.build_specs_[class_name]:
+                if type_name in values:
+                    value = values[type_name]
+                elif depth < 4:
+                    value = populate(type_name, depth + 1)
+                else:
+                    continue
+                setattr(obj, tag, [value, value] if many else value)
+            return obj
+
+        consumer = populate('Consumer')
+        sio = BytesIO()
+        consumer.export(sio, 0, pretty_print=False)
+        self.assertEqual(etree.tostring(gds_to_etree(consumer, 'Consumer', {'recordNumber': '1'})),
+                         etree.tostring(etree.fromstring(sio.getvalue().replace('<Consumer>',
+                                                                                '<Consumer recordNumber="1">', 1))))
+
+    def test_lazy_module(self):
+        """
+        neo.xml loads and stands in for the bindings in neo._xml.
+        """
+        from neo import _xml
+        self.assertIs(neo_xml.Consumer, _xml.Consumer)
+        with patch('neo.xml.ExternalEncoding', 'latin-1'):
+            self.assertEqual(_xml.ExternalEncoding, 'latin-1')
+        self.assertEqual(neo_xml.ExternalEncoding, _xml.ExternalEncoding)
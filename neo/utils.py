@@ -1,17 +1,27 @@
 import re
+import sys
+import gzip
+import time
 import pkgutil
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 
 from django.conf import settings
+from django.db.models import Q
 from lxml import etree
+try:
+    import lzma
+except ImportError:
+    try:
+        from backports import lzma
+    except ImportError:
+        lzma = None
 
 from foundry.models import Country
 
 from neo.constants import country_option_id, address_type, gender, \
     modify_flag, phone_type, email_category, comm_channel, question_category
-from neo.xml import Consumer, ConsumerProfileType, PreferencesType, UserAccountType, \
-    EmailDetailsType, PhoneDetailsType, AnswerType, CategoryType, LoginCredentialsType, \
-    QuestionAnswerType, AddressDetailsType
+from neo import xml
 
 
 # retrieve the brand id and promo code for the website
@@ -25,6 +35,103 @@ def normalize_username(username):
     return "%s%s" % (normal, max(0, 4 - len(normal)) * "0")
 
 
+class RateLimiter(object):
+    '''
+    Limits the rate at which calls to `wait` return, across threads
+    '''
+
+    def __init__(self, rate=None):
+        # rate is in calls per second, None or 0 for no limit
+        self.interval = 1.0 / rate if rate else 0
+        self.next_time = 0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.time()
+            delay = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+class Progress(object):
+    '''
+    Writes progress, throughput and the estimated time remaining for long running commands
+    '''
+
+    def __init__(self, total, stream=None, verb='Processed'):
+        self.total = total
+        self.done = 0
+        self.stream = stream or sys.stdout
+        self.verb = verb
+        self.start = time.time()
+
+    @property
+    def rate(self):
+        elapsed = time.time() - self.start
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def update(self, count=1):
+        self.done += count
+        rate = self.rate
+        eta = timedelta(seconds=int((self.total - self.done) / rate)) if rate else '?'
+        self.stream.write("\r%s %d out of %d (%.1f/s, ETA %s)" % (self.verb, self.done,
+                                                                  self.total, rate, eta))
+        self.stream.flush()
+
+    def finish(self):
+        self.stream.write("\nDone\n")
+
+
+def keyset_iterator(queryset, fields=('pk',), chunk_size=1000):
+    '''
+    Iterate over a queryset ordered by `fields`, which must identify the
+    objects uniquely, fetching `chunk_size` objects per query.
+
+    Each query continues after the last object of the previous one (keyset
+    pagination), instead of holding a cursor open over the whole queryset,
+    so memory use stays flat and each query sorts a single chunk.
+    '''
+    queryset = queryset.order_by(*fields)
+    chunk = list(queryset[:chunk_size])
+    while chunk:
+        for obj in chunk:
+            yield obj
+        if len(chunk) < chunk_size:
+            break
+        last = [getattr(chunk[-1], field) for field in fields]
+        chunk = list(queryset.filter(keyset_after(fields, last))[:chunk_size])
+
+
+def keyset_after(fields, values):
+    '''
+    Return a Q object for the rows after `values` in the ordering by `fields`
+    '''
+    q = None
+    for i, field in enumerate(fields):
+        lookups = dict(zip(fields[:i], values[:i]))
+        lookups['%s__gt' % field] = values[i]
+        q = Q(**lookups) if q is None else q | Q(**lookups)
+    return q
+
+
+def open_export_file(filepath):
+    """
+    Open a file written by `members_to_cidb_dataloadtool` for reading,
+    decompressing it if the filename ends in .gz or .xz.
+    """
+    if filepath.endswith('.xz'):
+        if lzma is None:
+            raise ImportError('Reading .xz files needs the lzma module (backports.lzma on Python 2).')
+        return lzma.LZMAFile(filepath)
+    elif filepath.endswith('.gz'):
+        return gzip.open(filepath, 'rb')
+    return open(filepath, 'rb')
+
+
 class ConsumerWrapper(object):
     '''
     A wrapper class that makes it easier to manage a consumer object
@@ -32,25 +139,25 @@ class ConsumerWrapper(object):
 
     def __init__(self, consumer=None):
         if consumer is None:
-            self._consumer = Consumer()
+            self._consumer = xml.Consumer()
         else:
             self._consumer = consumer
 
     def _get_or_create_profile(self):
         if self._consumer.ConsumerProfile is None:
             # Neo requires a title but Jmbo members don't have titles
-            self._consumer.ConsumerProfile = ConsumerProfileType(Title='', PromoCode=PROMO_CODE)
+            self._consumer.ConsumerProfile = xml.ConsumerProfileType(Title='', PromoCode=PROMO_CODE)
         return self._consumer.ConsumerProfile
 
     def _get_or_create_account(self):
         if self._consumer.UserAccount is None:
-            self._consumer.UserAccount = UserAccountType()
-            self._consumer.UserAccount.LoginCredentials = LoginCredentialsType()
+            self._consumer.UserAccount = xml.UserAccountType()
+            self._consumer.UserAccount.LoginCredentials = xml.LoginCredentialsType()
         return self._consumer.UserAccount
 
     def _get_or_create_preferences(self):
         if self._consumer.Preferences is None:
-            self._consumer.Preferences = PreferencesType()
+            self._consumer.Preferences = xml.PreferencesType()
         return self._consumer.Preferences
 
     @property
@@ -98,9 +205,9 @@ class ConsumerWrapper(object):
         # if the question category or question does not exist
         if not has_question:
             if not q_category:
-                q_category = CategoryType(CategoryID=category_id)
+                q_category = xml.CategoryType(CategoryID=category_id)
                 prefs.add_QuestionCategory(q_category)
-            q_answer = QuestionAnswerType(QuestionID=question_id)
+            q_answer = xml.QuestionAnswerType(QuestionID=question_id)
             q_category.add_QuestionAnswers(q_answer)
             q_answer.add_Answer(answer)
 
@@ -115,7 +222,7 @@ class ConsumerWrapper(object):
                     updated = True
                     break
         if not updated:
-            answer = AnswerType(
+            answer = xml.AnswerType(
                 OptionID=(1 if value else 99),
                 BrandID=brand_id,
                 CommunicationChannel=comm_channel
@@ -158,15 +265,21 @@ class ConsumerWrapper(object):
         return self._get_opt_in(64, BRAND_ID, comm_channel['EMAIL'])
 
     @property
-    def country(self):
+    def country_code(self):
         # 92 - country of residence?
         answers = self._get_preference(question_category['GENERAL'], 92)
         if answers is not None:
             country = answers[0].OptionID
             for code, option_id in country_option_id.iteritems():
                 if option_id == country:
-                    country = Country.objects.get(country_code=code)
-                    return country
+                    return code
+        return None
+
+    @property
+    def country(self):
+        code = self.country_code
+        if code is not None:
+            return Country.objects.get(country_code=code)
         return None
 
     @property
@@ -251,7 +364,7 @@ class ConsumerWrapper(object):
                 answers[0].OptionID = country_option_id[country.country_code]
                 answers[0].ModifyFlag = mod_flag
             else:
-                answer = AnswerType(OptionID=country_option_id[country.country_code])
+                answer = xml.AnswerType(OptionID=country_option_id[country.country_code])
                 self._set_preference(answer, question_category['GENERAL'], 92, mod_flag)
 
     def set_dob(self, dob, mod_flag=modify_flag['INSERT']):
@@ -285,7 +398,7 @@ class ConsumerWrapper(object):
                     updated = True
                     break
             if not updated:
-                profile.add_Address(AddressDetailsType(
+                profile.add_Address(xml.AddressDetailsType(
                     AddressType=address_type['HOME'],
                     Address1=address_line if address_line else 'null',
                     City=city if city else 'null',
@@ -310,7 +423,7 @@ class ConsumerWrapper(object):
                     updated = True
                     break
             if not updated:
-                prof.add_Email(EmailDetailsType(
+                prof.add_Email(xml.EmailDetailsType(
                     EmailId=email,
                     EmailCategory=email_category['PERSONAL'],
                     IsDefaultFlag=(0 if len(prof.Email) > 0 else 1),
@@ -321,12 +434,12 @@ class ConsumerWrapper(object):
         if mobile_number:
             prof = self._get_or_create_profile()
             if len(prof.Phone) == 0:
-                prof.add_Phone(PhoneDetailsType(
+                prof.add_Phone(xml.PhoneDetailsType(
                     PhoneNumber=mobile_number,
                     PhoneType=phone_type['MOBILE'],
                     ModifyFlag=mod_flag
                 ))
-                prof.add_Email(EmailDetailsType(
+                prof.add_Email(xml.EmailDetailsType(
                     EmailId=mobile_number,
                     EmailCategory=email_category['MOBILE_NO'],
                     IsDefaultFlag=(0 if len(prof.Email) > 0 else 1),
@@ -342,6 +455,132 @@ class ConsumerWrapper(object):
                         break
 
 
+# Option ID to country code, the first code of each option ID as in ConsumerWrapper.country_code
+_country_codes = {}
+for code, option_id in country_option_id.iteritems():
+    _country_codes.setdefault(option_id, code)
+del code, option_id
+
+
+def _child_elements(elem):
+    """
+    Return a dict of the local names of an element's children to the lists
+    of the children with that name, in document order.
+    """
+    children = {}
+    for child in elem:
+        children.setdefault(child.tag.rpartition('}')[2], []).append(child)
+    return children
+
+
+def _child_text(children, name):
+    # like the generated classes, the last of repeated elements wins
+    elems = children.get(name)
+    return elems[-1].text if elems else None
+
+
+def _child_integer(children, name):
+    elems = children.get(name)
+    return xml.build_integer_(elems[-1]) if elems else None
+
+
+def _child_preference(categories, category_id, question_id):
+    # see ConsumerWrapper._get_preference
+    for category in categories:
+        if _child_integer(category, 'CategoryID') == category_id:
+            for question in category.get('QuestionAnswers', ()):
+                question = _child_elements(question)
+                if _child_integer(question, 'QuestionID') == question_id:
+                    return question.get('Answer', [])
+    return None
+
+
+def consumer_member_dict(data):
+    """
+    Return the member attributes of a consumer, without building the
+    consumer objects.
+
+    The result is the same as that of reading `NEO_ATTR` from a
+    `ConsumerWrapper` of the parsed consumer and updating it with the
+    wrapper's `address`, but the elements that are read are only visited
+    once, and the countries are fetched in a single query.
+
+    :param data: The consumer XML, or its parsed lxml element.
+    """
+    root = data if etree.iselement(data) else xml.parsexml_string_(data)
+    consumer = _child_elements(root)
+    member = dict.fromkeys(('first_name', 'last_name', 'dob', 'email', 'mobile_number', 'gender'))
+    address = {}
+
+    profile = consumer.get('ConsumerProfile')
+    if profile:
+        profile = _child_elements(profile[-1])
+        member['first_name'] = _child_text(profile, 'FirstName')
+        member['last_name'] = _child_text(profile, 'LastName')
+        dob = _child_text(profile, 'DOB')
+        if dob is not None:
+            member['dob'] = datetime.strptime(dob, "%Y-%m-%d").date()
+        for email in profile.get('Email', ()):
+            email = _child_elements(email)
+            if _child_integer(email, 'EmailCategory') == email_category['PERSONAL']:
+                member['email'] = _child_text(email, 'EmailId')
+                break
+        for phone in profile.get('Phone', ()):
+            phone = _child_elements(phone)
+            if _child_integer(phone, 'PhoneType') == phone_type['MOBILE']:
+                member['mobile_number'] = _child_text(phone, 'PhoneNumber')
+                break
+        gender_id = _child_integer(profile, 'Gender')
+        if gender_id is not None:
+            member['gender'] = 'M' if gender_id == gender['MALE'] else 'F'
+        if profile.get('Address'):
+            a = _child_elements(profile['Address'][0])
+            address = {
+                'city': _child_text(a, 'City'),
+                'province': _child_text(a, 'StateOther'),
+                'zipcode': _child_text(a, 'ZipCode'),
+                'country': _child_text(a, 'Country'),
+                'address': _child_text(a, 'Address1'),
+            }
+
+    preferences = consumer.get('Preferences')
+    categories = []
+    if preferences:
+        categories = [_child_elements(category) for category in
+                      _child_elements(preferences[-1]).get('QuestionCategory', ())]
+    # 64 - receive communication from brand via communication channel?
+    opt_ins = _child_preference(categories, question_category['OPTIN'], 64)
+    for field, channel in (('receive_sms', comm_channel['SMS']), ('receive_email', comm_channel['EMAIL'])):
+        member[field] = None
+        for answer in opt_ins or ():
+            answer = _child_elements(answer)
+            if _child_integer(answer, 'CommunicationChannel') == channel:
+                member[field] = _child_integer(answer, 'OptionID') == 1
+                break
+    # 92 - country of residence?
+    country_code = None
+    answers = _child_preference(categories, question_category['GENERAL'], 92)
+    if answers is not None:
+        country_code = _country_codes.get(_child_integer(_child_elements(answers[0]), 'OptionID'))
+
+    codes = [code for code in (country_code, address.get('country')) if code is not None]
+    countries = {}
+    if codes:
+        countries = dict((c.country_code, c) for c in Country.objects.filter(country_code__in=codes))
+
+    def get_country(code):
+        try:
+            return countries[code]
+        except KeyError:
+            raise Country.DoesNotExist("Country matching query does not exist.")
+
+    member['country'] = None if country_code is None else get_country(country_code)
+    if address:
+        address['country'] = get_country(address['country'])
+    member.update(address)
+    return member
+
+
 class QuestionAnswersWrapper(object):
     '''
     A wrapper class to make it easier to construct objects that contain QuestionAnswers
@@ -354,7 +593,7 @@ class QuestionAnswersWrapper(object):
 
     def add_question_answer(self, question_id, category_id, option_id=None, answer_text=None, mod_flag=modify_flag['MODIFY']):
         obj = self.object
-        answer = AnswerType(OptionID=option_id, AnswerText=answer_text, ModifyFlag=mod_flag)
+        answer = xml.AnswerType(OptionID=option_id, AnswerText=answer_text, ModifyFlag=mod_flag)
         q_category = None
         has_question = False
         for cat in obj.QuestionCategory:
@@ -371,9 +610,9 @@ class QuestionAnswersWrapper(object):
         # if the question category or question does not exist
         if not has_question:
             if not q_category:
-                q_category = CategoryType(CategoryID=category_id)
+                q_category = xml.CategoryType(CategoryID=category_id)
                 obj.add_QuestionCategory(q_category)
-            q_answer = QuestionAnswerType(QuestionID=question_id)
+            q_answer = xml.QuestionAnswerType(QuestionID=question_id)
             q_category.add_QuestionAnswers(q_answer)
             q_answer.add_Answer(answer)
             self.answer_set.add(q_answer)
@@ -399,10 +638,10 @@ class QuestionAnswersWrapper(object):
                     if q in self.answer_set:
                         # if this is a new question, pad previous answer sets
                         for i in range(self.answer_sets - len(q.Answer)):
-                            q.Answer.insert(0, AnswerType(ModifyFlag=modify_flag['INSERT']))
+                            q.Answer.insert(0, xml.AnswerType(ModifyFlag=modify_flag['INSERT']))
                     else:
                         # if this is an existing question, pad current answer set
-                        q.add_Answer(AnswerType(ModifyFlag=modify_flag['INSERT']))
+                        q.add_Answer(xml.AnswerType(ModifyFlag=modify_flag['INSERT']))
                     assert self.answer_sets == len(q.Answer)
         self.answer_set.clear()
 
@@ -437,13 +676,55 @@ dataloadtool_schema_parser = etree.XMLParser()
 dataloadtool_schema_parser.resolvers.add(PythonPackageResolver('neo', 'schemas/dataloadtool/'))
 
 
+#: Cache of the schemas loaded by `dataloadtool_schema()`
+_dataloadtool_schemas = {}
+
+
 def dataloadtool_schema(name):
     """
     Load and return a NEO CIDB Data Load Tool XML schema.
 
+    Schemas are compiled once, and cached.
+
     :param str name: Schema name, such as "Consumers.xsd".
     :rtype: etree.XMLSchema
     """
-    doc = etree.parse(name, dataloadtool_schema_parser)
-    schema = etree.XMLSchema(doc)
+    schema = _dataloadtool_schemas.get(name)
+    if schema is None:
+        doc = etree.parse(name, dataloadtool_schema_parser)
+        schema = _dataloadtool_schemas[name] = etree.XMLSchema(doc)
     return schema
+
+
+def gds_to_etree(obj, tag, attrib=None):
+    """
+    Convert a generateDS object to an lxml element. This is equivalent to
+    parsing the output of the object's `export()`, without the round trip
+    through a string.
+
+    The children are written from `neo.xml.export_tables_`, like
+    `neo.xml.export_compact_`, so they are in the same order and formatted
+    the same as by the generated export methods.
+    """
+    entry = xml.export_tables_.get(type(obj))
+    if entry is None:
+        # subclasses may override the export methods
+        elem = etree.fromstring(xml.export_compact_(obj, tag))
+        elem.attrib.update(attrib or {})
+        return elem
+    elem = etree.Element(tag, attrib or {})
+    for name, format_, many, start_tag, end_tag in entry[1]:
+        value = getattr(obj, name)
+        if value is None:
+            continue
+        for item in (value if many else (value,)):
+            if format_ is None:
+                elem.append(gds_to_etree(item, name))
+                continue
+            child = etree.SubElement(elem, name)
+            if format_ is not xml.export_string_:
+                child.text = format_(item)
+            elif item:
+                # lxml escapes the text itself, see quote_xml
+                child.text = item if isinstance(item, basestring) else '%s' % item
+    return elem
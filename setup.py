@@ -23,7 +23,7 @@ setup(
         'jmbo-foundry>=1.1.15,<1.3',
         'django-ckeditor',
         'requests',
-        'lxml',
+        'lxml>=3.4',
         'django>=1.4,<1.5',
         'mock'
     ],
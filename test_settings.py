@@ -89,6 +89,7 @@ NEO = {
     'BRAND_ID': 0,
     'VERIFY_CERT': False,
     'USE_MCAL': True,
+    'ASYNC_NOTIFICATIONS': False,
 }
 
 LOGGING = {